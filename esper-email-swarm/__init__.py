@@ -38,12 +38,21 @@ from .model import (
 )
 from .agents import analyze_email_agents
 from .router import route_email, benevolence_clamp
-from .processor import process_email, process_email_file
+from .processor import (
+    process_email,
+    process_email_bytes,
+    process_email_file,
+    process_emails_batch,
+    process_emails_stream,
+)
 
 __all__ = [
     # Core processing
     "process_email",
+    "process_email_bytes",
     "process_email_file",
+    "process_emails_batch",
+    "process_emails_stream",
     # Models
     "VSEPacket",
     "EmailAnalysis", 
@@ -15,19 +15,24 @@ The agents are deterministic (same input → same output) and fully auditable.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+from .automaton import KeywordAutomaton, _trie_regex
 from .model import (
     VSEPacket,
     IntentSpine,
     AffectLattice,
     semantic_hash,
+    _DATACLASS_SLOTS,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AgentConfig:
     """Configuration for a specialized semantic agent"""
     role: str
@@ -65,6 +70,38 @@ AGENTS: Dict[str, AgentConfig] = {
 }
 
 
+# ============================================================================
+# Keyword Scanning
+# ============================================================================
+
+def _build_automaton(keywords: Sequence[str]) -> KeywordAutomaton:
+    """Compile a keyword list into an automaton whose payload is the keyword index"""
+    automaton = KeywordAutomaton()
+    for keyword_id, keyword in enumerate(keywords):
+        automaton.add_word(keyword, keyword_id)
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_counts(
+    automaton: KeywordAutomaton, keywords: Sequence[str], text_lower: str
+) -> List[int]:
+    """
+    Count occurrences of every keyword in a single pass over the text.
+
+    Counts follow ``str.count`` semantics: occurrences of the same keyword
+    never overlap (different keywords may).
+    """
+    counts = [0] * len(keywords)
+    next_start = [0] * len(keywords)
+    for end, keyword_id in automaton.iter(text_lower):
+        start = end - len(keywords[keyword_id]) + 1
+        if start >= next_start[keyword_id]:
+            counts[keyword_id] += 1
+            next_start[keyword_id] = end + 1
+    return counts
+
+
 # ============================================================================
 # Urgency Agent
 # ============================================================================
@@ -90,6 +127,10 @@ URGENCY_KEYWORDS = {
     'hurry': 0.6,
 }
 
+# Frozen (keyword, weight) pairs so the hot loop never touches the dict
+_URGENCY_ITEMS: Tuple[Tuple[str, float], ...] = tuple(URGENCY_KEYWORDS.items())
+_URGENCY_WORDS: Tuple[str, ...] = tuple(keyword for keyword, _ in _URGENCY_ITEMS)
+
 # Temporal patterns that indicate deadlines
 TEMPORAL_PATTERNS = [
     r'\d{1,2}/\d{1,2}(/\d{2,4})?',  # Date: 12/15 or 12/15/2024
@@ -101,37 +142,45 @@ TEMPORAL_PATTERNS = [
     r'(in|within)\s+\d+\s+(hour|day|week)s?',  # Within timeframe
 ]
 
+# All temporal patterns as one alternation: the text is scanned once.
+# It runs on the lowercased text, so it is compiled case-sensitively
+# (patterns must be written in lowercase).
+_TEMPORAL_UNION = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in TEMPORAL_PATTERNS)
+)
+
 
-def analyze_urgency(text: str, metadata: Dict) -> Tuple[float, float, str]:
+def analyze_urgency(
+    text: str,
+    metadata: Dict,
+    *,
+    text_lower: Optional[str] = None,
+    scan: Optional[KeywordScan] = None,
+) -> Tuple[float, float, str]:
     """
     Analyze temporal urgency and deadline pressure.
     
+    Args:
+        text: Email text
+        metadata: Email metadata dict
+        text_lower: Precomputed text.lower() (computed when omitted)
+        scan: Precomputed keyword scan (scanned from text when omitted)
+    
     Returns:
         (urgency_score, tension_score, gloss)
     """
-    text_lower = text.lower()
-    
-    # Score keyword urgency (weighted)
-    urgency_score = 0.0
-    keyword_count = 0
-    for keyword, weight in URGENCY_KEYWORDS.items():
-        count = text_lower.count(keyword)
-        if count > 0:
-            urgency_score += weight * min(count, 3)  # Cap at 3 occurrences
-            keyword_count += count
-    
-    # Normalize by occurrence count
-    if keyword_count > 0:
+    if text_lower is None:
+        text_lower = text.lower()
+    if scan is None:
+        scan = scan_keywords(text_lower)
+    
+    # Score keyword urgency (weighted), normalized when any keyword hit
+    urgency_score = scan.urgency_weight
+    if scan.urgency_hits > 0:
         urgency_score = min(1.0, urgency_score / 3.0)
     
-    # Check for temporal patterns (deadline indicators)
-    has_temporal = False
-    temporal_count = 0
-    for pattern in TEMPORAL_PATTERNS:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
-        if matches:
-            has_temporal = True
-            temporal_count += len(matches)
+    # Check for temporal patterns (deadline indicators); the first hit is enough
+    has_temporal = _TEMPORAL_UNION.search(text_lower) is not None
     
     # Boost urgency if temporal patterns present
     if has_temporal:
@@ -194,31 +243,47 @@ IMPORTANCE_DOMAINS = {
     },
 }
 
+# Frozen (domain, keywords, weight) records so the hot loop never touches the dicts
+_IMPORTANCE_ITEMS: Tuple[Tuple[str, Tuple[str, ...], float], ...] = tuple(
+    (domain, tuple(config['keywords']), config['weight'])
+    for domain, config in IMPORTANCE_DOMAINS.items()
+)
+
+# One automaton across all domains; a keyword listed in several domains
+# (e.g. 'salary') gets one id per domain.
+_IMPORTANCE_WORDS: Tuple[str, ...] = tuple(
+    keyword for _, keywords, _ in _IMPORTANCE_ITEMS for keyword in keywords
+)
+
 
-def analyze_importance(text: str, metadata: Dict) -> Tuple[float, str, str]:
+def analyze_importance(
+    text: str,
+    metadata: Dict,
+    *,
+    text_lower: Optional[str] = None,
+    scan: Optional[KeywordScan] = None,
+) -> Tuple[float, str, str]:
     """
     Analyze long-term importance across life domains.
     
+    Args:
+        text: Email text
+        metadata: Email metadata dict
+        text_lower: Precomputed text.lower() (computed when omitted)
+        scan: Precomputed keyword scan (scanned from text when omitted)
+    
     Returns:
         (importance_score, dominant_domain, gloss)
     """
-    text_lower = text.lower()
-    
     # Score each domain
-    domain_scores: Dict[str, float] = {}
-    for domain, config in IMPORTANCE_DOMAINS.items():
-        score = 0
-        for keyword in config['keywords']:
-            count = text_lower.count(keyword)
-            if count > 0:
-                score += count * config['weight']
-        if score > 0:
-            domain_scores[domain] = score
+    if scan is None:
+        scan = scan_keywords(text.lower() if text_lower is None else text_lower)
+    domain_scores = scan.domain_scores
     
     # Calculate overall importance
     if domain_scores:
         # Get dominant domain
-        dominant_domain = max(domain_scores.items(), key=lambda x: x[1])[0]
+        dominant_domain = scan.dominant_domain
         total_score = sum(domain_scores.values())
         importance_score = min(1.0, total_score / 5.0)
     else:
@@ -240,47 +305,69 @@ def analyze_importance(text: str, metadata: Dict) -> Tuple[float, str, str]:
 # Topic Agent
 # ============================================================================
 
-def analyze_topic(text: str, metadata: Dict) -> Tuple[str, str]:
+# Common words never chosen as a body-derived topic
+_STOP_WORDS = frozenset({
+    'that', 'this', 'with', 'from', 'have', 'will', 'your', 'they',
+    'been', 'were', 'said', 'would', 'there', 'their', 'what', 'about',
+})
+
+# Candidate topic words: whole words of 4+ letters
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Reply/forward prefixes stripped from the subject before topic extraction
+_SUBJECT_PREFIX_RE = re.compile(r'^(?:re|fwd|fw):\s*', re.IGNORECASE)
+
+
+def analyze_topic(
+    text: str,
+    metadata: Dict,
+    *,
+    text_lower: Optional[str] = None,
+    scan: Optional[KeywordScan] = None,
+) -> Tuple[str, str]:
     """
     Extract dominant topic or project.
     
+    Args:
+        text: Email text
+        metadata: Email metadata dict
+        text_lower: Precomputed text.lower() (computed when omitted)
+        scan: Precomputed keyword scan (scanned from text when omitted)
+    
     Returns:
         (topic, gloss)
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    if scan is None:
+        scan = scan_keywords(text_lower)
     
-    # Try importance domains first (most specific)
-    for domain, config in IMPORTANCE_DOMAINS.items():
-        for keyword in config['keywords']:
-            if keyword in text_lower:
-                return domain, f"Primary topic: {domain}"
+    # Try importance domains first (most specific); domain_scores is in
+    # IMPORTANCE_DOMAINS order, so the first key is the first domain hit
+    for domain in scan.domain_scores:
+        return domain, f"Primary topic: {domain}"
     
     # Extract from subject line if available
     subject = metadata.get('subject', '')
     if subject:
         # Remove common prefixes
-        subject_clean = re.sub(r'^(re:|fwd:|fw:)\s*', '', subject, flags=re.IGNORECASE).strip()
+        subject_clean = _SUBJECT_PREFIX_RE.sub('', subject).strip()
         
         # Extract first meaningful word (4+ chars)
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', subject_clean)
-        if words:
-            topic = words[0].lower()
+        match = _WORD_RE.search(subject_clean)
+        if match:
+            topic = match.group().lower()
             return topic, f"Primary topic: {topic}"
     
-    # Fallback: extract common nouns from body
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', text_lower)
-    
-    # Filter out common stop words
-    stop_words = {'that', 'this', 'with', 'from', 'have', 'will', 'your', 'they',
-                  'been', 'were', 'said', 'would', 'there', 'their', 'what', 'about'}
-    
-    word_freq: Dict[str, int] = {}
-    for word in words:
-        if word not in stop_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-    
+    # Fallback: most common non-stop-word in the body
+    # (Counter keeps first-seen order, so ties go to the earliest word).
+    # Counting the whole list runs in C; dropping the few stop words
+    # afterwards is cheaper than filtering every word through a generator.
+    word_freq = Counter(_WORD_RE.findall(text_lower))
+    for word in _STOP_WORDS:
+        word_freq.pop(word, None)
     if word_freq:
-        topic = max(word_freq.items(), key=lambda x: x[1])[0]
+        topic = word_freq.most_common(1)[0][0]
         return topic, f"Primary topic: {topic}"
     
     return "general", "Primary topic: general communication"
@@ -312,33 +399,46 @@ FORMALITY_INDICATORS = [
     'mr.', 'ms.', 'mrs.', 'dr.', 'prof.',
 ]
 
+# Sender substrings suggesting a personal relationship
+_PERSONAL_SENDER_RE = re.compile(
+    r'mom|dad|mother|father|sister|brother|family|friend|personal'
+)
+
 
-def analyze_tone(text: str, metadata: Dict) -> Tuple[float, float, float, str]:
+def analyze_tone(
+    text: str,
+    metadata: Dict,
+    *,
+    text_lower: Optional[str] = None,
+    scan: Optional[KeywordScan] = None,
+) -> Tuple[float, float, float, str]:
     """
     Analyze emotional tone and relationship warmth.
     
+    Args:
+        text: Email text
+        metadata: Email metadata dict
+        text_lower: Precomputed text.lower() (computed when omitted)
+        scan: Precomputed keyword scan (scanned from text when omitted)
+    
     Returns:
         (warmth, tension, formality, gloss)
     """
-    text_lower = text.lower()
+    if scan is None:
+        scan = scan_keywords(text.lower() if text_lower is None else text_lower)
     
     # Calculate warmth
-    warmth_count = sum(1 for indicator in WARMTH_INDICATORS if indicator in text_lower)
-    warmth = min(1.0, warmth_count / 5.0)
+    warmth = min(1.0, scan.warmth_count / 5.0)
     
     # Calculate tension
-    tension_count = sum(1 for indicator in TENSION_INDICATORS if indicator in text_lower)
-    tension = min(1.0, tension_count / 5.0)
+    tension = min(1.0, scan.tension_count / 5.0)
     
     # Calculate formality
-    formality_count = sum(1 for indicator in FORMALITY_INDICATORS if indicator in text_lower)
-    formality = min(1.0, formality_count / 3.0)
+    formality = min(1.0, scan.formality_count / 3.0)
     
     # Adjust for personal relationships (in sender)
     sender = metadata.get('sender', '').lower()
-    personal_indicators = ['mom', 'dad', 'mother', 'father', 'sister', 'brother', 
-                          'family', 'friend', 'personal']
-    if any(ind in sender for ind in personal_indicators):
+    if _PERSONAL_SENDER_RE.search(sender):
         warmth = min(1.0, warmth + 0.3)
         formality = max(0.0, formality - 0.4)
     
@@ -361,6 +461,86 @@ def analyze_tone(text: str, metadata: Dict) -> Tuple[float, float, float, str]:
     return warmth, tension, formality, gloss
 
 
+# ============================================================================
+# Fused Keyword Scan
+# ============================================================================
+
+@dataclass(**_DATACLASS_SLOTS)
+class KeywordScan:
+    """
+    Keyword evidence for every agent, gathered in one pass over the text.
+    
+    The urgency, importance, topic and tone agents read their inputs from
+    this instead of each scanning the email on their own.
+    """
+    urgency_weight: float = 0.0   # Sum of weight * min(count, 3) over URGENCY_KEYWORDS
+    urgency_hits: int = 0         # Total urgency keyword occurrences
+    domain_scores: Dict[str, float] = field(default_factory=dict)  # Domains hit, in IMPORTANCE_DOMAINS order
+    dominant_domain: str = "general"  # Highest-scoring domain (first on ties)
+    warmth_count: int = 0         # Distinct WARMTH_INDICATORS present
+    tension_count: int = 0        # Distinct TENSION_INDICATORS present
+    formality_count: int = 0      # Distinct FORMALITY_INDICATORS present
+
+
+# Every agent vocabulary in one automaton; each vocabulary occupies a
+# contiguous range of keyword ids so counts can be sliced per agent.
+_GLOBAL_WORDS: Tuple[str, ...] = (
+    _URGENCY_WORDS
+    + _IMPORTANCE_WORDS
+    + tuple(WARMTH_INDICATORS)
+    + tuple(TENSION_INDICATORS)
+    + tuple(FORMALITY_INDICATORS)
+)
+_IMPORTANCE_START = len(_URGENCY_WORDS)
+_WARMTH_START = _IMPORTANCE_START + len(_IMPORTANCE_WORDS)
+_TENSION_START = _WARMTH_START + len(WARMTH_INDICATORS)
+_FORMALITY_START = _TENSION_START + len(TENSION_INDICATORS)
+_GLOBAL_AC = _build_automaton(_GLOBAL_WORDS)
+
+
+def scan_keywords(text_lower: str) -> KeywordScan:
+    """
+    Scan lowercased text once for all agent keyword vocabularies.
+    
+    Args:
+        text_lower: Lowercased email text
+        
+    Returns:
+        KeywordScan with per-agent keyword evidence
+    """
+    counts = _keyword_counts(_GLOBAL_AC, _GLOBAL_WORDS, text_lower)
+    scan = KeywordScan()
+    
+    # Urgency: weighted, each keyword capped at 3 occurrences
+    for (_, weight), count in zip(_URGENCY_ITEMS, counts):
+        if count > 0:
+            scan.urgency_weight += weight * min(count, 3)
+            scan.urgency_hits += count
+    
+    # Importance: weighted occurrences per domain
+    keyword_id = _IMPORTANCE_START
+    best_score = 0
+    for domain, keywords, weight in _IMPORTANCE_ITEMS:
+        score = 0
+        for _ in keywords:
+            count = counts[keyword_id]
+            keyword_id += 1
+            if count > 0:
+                score += count * weight
+        if score > 0:
+            scan.domain_scores[domain] = score
+            if score > best_score:
+                best_score = score
+                scan.dominant_domain = domain
+    
+    # Tone: number of distinct indicators present
+    scan.warmth_count = sum(1 for count in counts[_WARMTH_START:_TENSION_START] if count)
+    scan.tension_count = sum(1 for count in counts[_TENSION_START:_FORMALITY_START] if count)
+    scan.formality_count = sum(1 for count in counts[_FORMALITY_START:] if count)
+    
+    return scan
+
+
 # ============================================================================
 # Action Agent
 # ============================================================================
@@ -410,28 +590,106 @@ ACTION_PATTERNS = {
 }
 
 
-def analyze_action(text: str, metadata: Dict, urgency: float, importance: float) -> Tuple[str, str]:
+def _leading_literal(pattern: str) -> str:
+    """
+    Return the literal text every match of an action pattern starts with.
+    
+    Raises:
+        ValueError: If the pattern does not start with literal text or
+            has a top-level alternation
+    """
+    depth = 0
+    in_class = escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            raise ValueError(f"Action pattern has a top-level alternation: {pattern!r}")
+    
+    match = re.match(r"(?:[a-z']|\\[?'])*", pattern)
+    literal = match.group().replace("\\", "")
+    if pattern[match.end():match.end() + 1] in ('?', '*', '{'):
+        # The last character is optional, so it is not part of every match
+        literal = literal[:-1]
+    if not literal:
+        raise ValueError(f"Action pattern has no leading literal: {pattern!r}")
+    return literal
+
+
+# Each action pattern precompiled on its own. Patterns are counted
+# separately (overlapping matches from different patterns all count, e.g.
+# 'please review' scores for both review and task), so they cannot share a
+# single alternation. Like the temporal union they only see lowercased text
+# and are compiled case-sensitively.
+_ACTION_REGEXES: Tuple[Tuple[str, Tuple[re.Pattern, ...]], ...] = tuple(
+    (action_type, tuple(re.compile(pattern) for pattern in config['patterns']))
+    for action_type, config in ACTION_PATTERNS.items()
+)
+
+# Every match starts with one of these literals. A trie-shaped lookahead on
+# them rejects most positions after a character or two, so the union below
+# is a cheap prefilter: text it does not match has no action phrase at all
+# and goes straight to the fallback without the per-pattern scans.
+_ACTION_LITERALS: Tuple[str, ...] = tuple(sorted({
+    _leading_literal(pattern)
+    for config in ACTION_PATTERNS.values()
+    for pattern in config['patterns']
+}))
+_ACTION_UNION = re.compile(
+    "(?=" + _trie_regex(list(_ACTION_LITERALS)) + ")(?:"
+    + "|".join(
+        f"(?:{pattern})"
+        for config in ACTION_PATTERNS.values()
+        for pattern in config['patterns']
+    )
+    + ")"
+)
+
+def analyze_action(
+    text: str,
+    metadata: Dict,
+    urgency: float,
+    importance: float,
+    *,
+    text_lower: Optional[str] = None,
+) -> Tuple[str, str]:
     """
     Determine required next action.
     
+    Args:
+        text: Email text
+        metadata: Email metadata dict
+        urgency: Urgency score from the urgency agent
+        importance: Importance score from the importance agent
+        text_lower: Precomputed text.lower() (computed when omitted)
+    
     Returns:
         (action_category, action_gloss)
     """
-    text_lower = text.lower()
-    
-    # Score each action type
-    action_scores: Dict[str, int] = {}
-    for action_type, config in ACTION_PATTERNS.items():
-        score = 0
-        for pattern in config['patterns']:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            score += len(matches)
-        if score > 0:
-            action_scores[action_type] = score
-    
-    # Determine primary action
-    if action_scores:
-        primary_action = max(action_scores.items(), key=lambda x: x[1])[0]
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Score each action type; the primary action is the most frequent one,
+    # walking ACTION_PATTERNS in order so ties go to the earlier action type
+    primary_action: Optional[str] = None
+    if _ACTION_UNION.search(text_lower) is not None:
+        best_count = 0
+        for action_type, regexes in _ACTION_REGEXES:
+            count = sum(len(regex.findall(text_lower)) for regex in regexes)
+            if count > best_count:
+                primary_action, best_count = action_type, count
+    
+    if primary_action is not None:
         action_gloss = ACTION_PATTERNS[primary_action]['action']
     else:
         # Fallback based on urgency/importance
@@ -449,6 +707,58 @@ def analyze_action(text: str, metadata: Dict, urgency: float, importance: float)
 # Main Agent Orchestrator
 # ============================================================================
 
+# Topic, tone and action motifs hash short labels drawn from a small set of
+# values, so their digests repeat across emails and are worth memoizing.
+# (Urgency/importance motifs include the email text and are hashed directly.)
+_label_hash = lru_cache(maxsize=4096)(semantic_hash)
+
+
+@lru_cache(maxsize=256)
+def _agent_results(full_text: str, sender: str, subject: str) -> Tuple:
+    """
+    Scores, glosses and text-derived motifs of all 5 agents.
+    
+    The agents only read the sender and subject from the metadata, so
+    their results depend on these three strings alone. Memoizing them lets
+    repeated messages (the same mail fetched from several folders, resent
+    notifications) skip the scans. Packets are still built per call, so
+    every analysis gets fresh packets and timestamps.
+    """
+    metadata = {'sender': sender, 'subject': subject}
+    
+    # Lowercase once and scan all keyword vocabularies in a single pass
+    text_lower = full_text.lower()
+    scan = scan_keywords(text_lower)
+    
+    # Run each agent
+    urgency_score, tension_score, urgency_gloss = analyze_urgency(
+        full_text, metadata, text_lower=text_lower, scan=scan
+    )
+    importance_score, domain, importance_gloss = analyze_importance(
+        full_text, metadata, text_lower=text_lower, scan=scan
+    )
+    topic, topic_gloss = analyze_topic(full_text, metadata, text_lower=text_lower, scan=scan)
+    warmth, tone_tension, formality, tone_gloss = analyze_tone(
+        full_text, metadata, text_lower=text_lower, scan=scan
+    )
+    action_str, action_gloss = analyze_action(
+        full_text, metadata, urgency_score, importance_score, text_lower=text_lower
+    )
+    
+    # Text prefix shared by the urgency and importance motifs, encoded once
+    prefix_bytes = full_text[:100].encode("utf-8", "ignore")
+    urgency_motif = semantic_hash(b"urgency:%s:%s" % (str(urgency_score).encode(), prefix_bytes))
+    importance_motif = semantic_hash(b"importance:%s:%s" % (domain.encode(), prefix_bytes))
+    
+    return (
+        urgency_score, tension_score, urgency_gloss, urgency_motif,
+        importance_score, importance_gloss, importance_motif,
+        topic, topic_gloss,
+        warmth, tone_tension, formality, tone_gloss,
+        action_str, action_gloss,
+    )
+
+
 def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dict[str, VSEPacket]:
     """
     Run all 5 agents on the provided email text.
@@ -469,12 +779,16 @@ def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dic
     if metadata is None:
         metadata = {}
     
-    # Run each agent
-    urgency_score, tension_score, urgency_gloss = analyze_urgency(full_text, metadata)
-    importance_score, domain, importance_gloss = analyze_importance(full_text, metadata)
-    topic, topic_gloss = analyze_topic(full_text, metadata)
-    warmth, tone_tension, formality, tone_gloss = analyze_tone(full_text, metadata)
-    action_str, action_gloss = analyze_action(full_text, metadata, urgency_score, importance_score)
+    (
+        urgency_score, tension_score, urgency_gloss, urgency_motif,
+        importance_score, importance_gloss, importance_motif,
+        topic, topic_gloss,
+        warmth, tone_tension, formality, tone_gloss,
+        action_str, action_gloss,
+    ) = _agent_results(full_text, metadata.get('sender', ''), metadata.get('subject', ''))
+    
+    # One clock read stamps all 5 packets of this email
+    now_ns = time.time_ns()
     
     packets: Dict[str, VSEPacket] = {}
     
@@ -491,9 +805,10 @@ def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dic
         affect_lattice=AffectLattice(
             fear=tension_score * 0.8,
         ),
-        semantic_motif=semantic_hash(f"urgency:{urgency_score}:{full_text[:100]}"),
+        semantic_motif=urgency_motif,
         gloss=urgency_gloss,
         confidence=0.95,
+        timestamp_ns=now_ns,
     )
     
     # Importance packet
@@ -507,9 +822,10 @@ def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dic
             confidence=0.9,
         ),
         affect_lattice=AffectLattice(),
-        semantic_motif=semantic_hash(f"importance:{domain}:{full_text[:100]}"),
+        semantic_motif=importance_motif,
         gloss=importance_gloss,
         confidence=0.9,
+        timestamp_ns=now_ns,
     )
     
     # Topic packet
@@ -523,9 +839,10 @@ def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dic
             confidence=0.85,
         ),
         affect_lattice=AffectLattice(),
-        semantic_motif=semantic_hash(f"topic:{topic}"),
+        semantic_motif=_label_hash(f"topic:{topic}"),
         gloss=topic_gloss,
         confidence=0.85,
+        timestamp_ns=now_ns,
     )
     
     # Tone packet
@@ -543,9 +860,10 @@ def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dic
             fear=tone_tension * 0.7,
             trust=warmth * 0.8,
         ),
-        semantic_motif=semantic_hash(f"tone:{warmth}:{tone_tension}:{formality}"),
+        semantic_motif=_label_hash(f"tone:{warmth}:{tone_tension}:{formality}"),
         gloss=tone_gloss,
         confidence=0.9,
+        timestamp_ns=now_ns,
     )
     
     # Action packet
@@ -559,9 +877,10 @@ def analyze_email_agents(full_text: str, metadata: Optional[Dict] = None) -> Dic
             confidence=0.9,
         ),
         affect_lattice=AffectLattice(),
-        semantic_motif=semantic_hash(f"action:{action_str}"),
+        semantic_motif=_label_hash(f"action:{action_str}"),
         gloss=action_gloss,
         confidence=0.9,
+        timestamp_ns=now_ns,
     )
     
     return packets
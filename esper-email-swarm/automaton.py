@@ -0,0 +1,141 @@
+"""
+ESPER Email Swarm - Keyword Automaton
+
+Multi-pattern keyword matching for the agent swarm.
+
+The agents score text against dictionaries of literal keywords. Instead of
+scanning the email once per keyword, every keyword is compiled into a single
+Aho–Corasick style automaton that reports all occurrences in one pass.
+
+When the optional ``pyahocorasick`` C extension is installed
+(``pip install esper-email-swarm[fast]``) it is used directly. Otherwise an
+equivalent trie-shaped regular expression from the standard library is used,
+so the package keeps working with zero external dependencies. Both backends
+report exactly the same hits.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:  # pragma: no cover - depends on the environment
+    _ahocorasick = None
+
+
+class KeywordAutomaton:
+    """
+    Aho–Corasick keyword automaton.
+
+    Mirrors the small subset of the ``pyahocorasick.Automaton`` API the
+    agents need: ``add_word``, ``make_automaton`` and ``iter``.
+
+    Example:
+        >>> ac = KeywordAutomaton()
+        >>> ac.add_word('quick', 0)
+        >>> ac.add_word('quickly', 1)
+        >>> ac.make_automaton()
+        >>> sorted(ac.iter('run quickly'))
+        [(8, 0), (10, 1)]
+    """
+
+    def __init__(self) -> None:
+        self._payloads: Dict[str, List[Any]] = {}
+        self._ac: Any = None
+        self._pattern: Optional[Pattern[str]] = None
+        self._prefix_hits: Dict[str, Tuple[Tuple[int, Any], ...]] = {}
+
+    def add_word(self, word: str, payload: Any) -> None:
+        """
+        Register a keyword.
+
+        A keyword may be added several times with different payloads
+        (e.g. the same word in two domains); every payload is reported
+        for each occurrence.
+
+        Raises:
+            ValueError: If the keyword is empty
+        """
+        if not word:
+            raise ValueError("Cannot add an empty keyword to the automaton")
+        self._payloads.setdefault(word, []).append(payload)
+
+    def make_automaton(self) -> None:
+        """Compile the registered keywords. Must be called before ``iter``."""
+        if _ahocorasick is not None:
+            ac = _ahocorasick.Automaton()
+            for word, payloads in self._payloads.items():
+                ac.add_word(word, (len(word), tuple(payloads)))
+            ac.make_automaton()
+            self._ac = ac
+            return
+
+        # Standard library fallback: a trie-shaped regex inside a lookahead
+        # finds the longest keyword starting at every position in one scan.
+        # Any other keyword starting at that position is necessarily a
+        # prefix of the longest one, so those hits are precomputed here.
+        words = sorted(self._payloads)
+        for word in words:
+            self._prefix_hits[word] = tuple(
+                (len(prefix) - 1, payload)
+                for prefix in words
+                if word.startswith(prefix)
+                for payload in self._payloads[prefix]
+            )
+        self._pattern = re.compile("(?=(" + _trie_regex(words) + "))")
+
+    def iter(self, text: str) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield ``(end_index, payload)`` for every keyword occurrence in text.
+
+        Occurrences may overlap. Callers should not rely on the order in
+        which hits are reported, only that each occurrence is reported once.
+
+        Raises:
+            ValueError: If ``make_automaton`` has not been called
+        """
+        if self._ac is not None:
+            for end, (_, payloads) in self._ac.iter(text):
+                for payload in payloads:
+                    yield end, payload
+            return
+
+        if self._pattern is None:
+            if not self._payloads:
+                return
+            raise ValueError("Automaton not compiled. Call make_automaton() first.")
+
+        prefix_hits = self._prefix_hits
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for offset, payload in prefix_hits[match.group(1)]:
+                yield start + offset, payload
+
+
+def _trie_regex(words: List[str]) -> str:
+    """
+    Build a regex alternation shaped like a trie of the given words.
+
+    Factoring common prefixes lets the regex engine reject most positions
+    after a single character comparison. Optional suffixes are greedy, so
+    the longest keyword at a position is matched.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        is_word_end = "" in node
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if is_word_end else "")
+
+    return emit(trie)
@@ -12,7 +12,7 @@ import sys
 from pathlib import Path
 from typing import Optional, List
 
-from .processor import process_email, process_email_file
+from .processor import process_emails_stream, process_email_file
 from .imap_client import IMAPClient, get_imap_config, IMAP_SERVERS
 from .router import explain_routing
 from . import __version__
@@ -84,6 +84,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=10,
         help='Maximum number of messages to fetch (default: 10)',
     )
+    imap_group.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Analyze fetched messages in N parallel processes (default: 1)',
+    )
     imap_group.add_argument(
         '--search',
         default='ALL',
@@ -153,22 +160,33 @@ def main(argv: Optional[List[str]] = None) -> int:
                 print(f"Connecting to {args.host}...", file=sys.stderr)
             
             with IMAPClient(args.host, args.user, args.password) as client:
-                messages = client.fetch_messages(
+                messages = client.iter_messages(
                     mailbox=args.mailbox,
                     limit=args.limit,
                     search_criteria=args.search,
                 )
                 
                 if not args.quiet:
-                    print(f"Processing {len(messages)} messages...", file=sys.stderr)
+                    print(f"Processing up to {args.limit} messages...", file=sys.stderr)
                 
-                for msg_id, raw_email in messages:
-                    try:
-                        analysis = process_email(raw_email)
-                        results.append(analysis)
-                    except Exception as e:
-                        print(f"Warning: Failed to process message {msg_id}: {e}", file=sys.stderr)
+                # Messages are analyzed while later FETCH batches download
+                msg_ids: List[str] = []
+                
+                def raw_emails():
+                    for msg_id, raw_email in messages:
+                        msg_ids.append(msg_id)
+                        yield raw_email
+                
+                analyses = process_emails_stream(
+                    raw_emails(),
+                    workers=args.workers,
+                    return_exceptions=True,
+                )
+                for i, analysis in enumerate(analyses):
+                    if isinstance(analysis, Exception):
+                        print(f"Warning: Failed to process message {msg_ids[i]}: {analysis}", file=sys.stderr)
                         continue
+                    results.append(analysis)
         
         # Output results
         if not args.quiet:
@@ -9,7 +9,12 @@ from __future__ import annotations
 
 import imaplib
 import os
-from typing import List, Tuple, Optional
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Optional
 import getpass
 
 
@@ -82,18 +87,65 @@ class IMAPClient:
         mailbox: str = 'INBOX',
         limit: int = 10,
         search_criteria: str = 'ALL',
-    ) -> List[Tuple[str, str]]:
+        header_only: bool = False,
+        body_bytes: Optional[int] = 16384,
+    ) -> List[Tuple[str, bytes]]:
         """
         Fetch messages from specified mailbox.
         
+        Messages are fetched with BODY.PEEK, so they are never marked as
+        read, and only the headers plus the first ``body_bytes`` of the body
+        are downloaded. Analysis only looks at the start of the body, so
+        large attachments need not cross the wire.
+        
         Args:
             mailbox: Mailbox name (default: 'INBOX')
             limit: Maximum number of messages to fetch
             search_criteria: IMAP search criteria (default: 'ALL')
                 Examples: 'UNSEEN', 'FROM "user@example.com"', 'SUBJECT "urgent"'
+            header_only: Fetch headers only, without any body
+            body_bytes: Maximum body bytes to fetch per message
+                (None fetches the complete message)
         
         Returns:
-            List of (message_id, raw_email_string) tuples
+            List of (message_id, raw_email_bytes) tuples
+            
+        Raises:
+            ValueError: If not connected
+            imaplib.IMAP4.error: If mailbox selection or search fails
+        """
+        return list(self.iter_messages(
+            mailbox, limit, search_criteria, header_only, body_bytes, batch_size=None,
+        ))
+    
+    def iter_messages(
+        self,
+        mailbox: str = 'INBOX',
+        limit: int = 10,
+        search_criteria: str = 'ALL',
+        header_only: bool = False,
+        body_bytes: Optional[int] = 16384,
+        batch_size: Optional[int] = 50,
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yield messages from specified mailbox as each FETCH batch arrives.
+        
+        Same as ``fetch_messages``, but messages are fetched ``batch_size``
+        at a time and yielded lazily. A consumer that hands messages to
+        worker processes (see ``process_emails_stream``) keeps the workers
+        busy on one batch while the next is downloaded.
+        
+        Args:
+            mailbox: Mailbox name (default: 'INBOX')
+            limit: Maximum number of messages to fetch
+            search_criteria: IMAP search criteria (default: 'ALL')
+            header_only: Fetch headers only, without any body
+            body_bytes: Maximum body bytes to fetch per message
+                (None fetches the complete message)
+            batch_size: Messages per FETCH command (None fetches all at once)
+        
+        Yields:
+            (message_id, raw_email_bytes) tuples, oldest first
             
         Raises:
             ValueError: If not connected
@@ -102,41 +154,62 @@ class IMAPClient:
         if not self.connection:
             raise ValueError("Not connected. Call connect() first.")
         
-        # Select mailbox
-        status, _ = self.connection.select(mailbox, readonly=True)
+        # Select mailbox (the reply carries the number of messages)
+        status, data = self.connection.select(mailbox, readonly=True)
         if status != 'OK':
             raise imaplib.IMAP4.error(f"Failed to select mailbox: {mailbox}")
         
-        # Search for messages
-        status, data = self.connection.search(None, search_criteria)
-        if status != 'OK':
-            raise imaplib.IMAP4.error(f"Search failed with criteria: {search_criteria}")
-        
-        message_ids = data[0].split()
+        if search_criteria == 'ALL' and limit > 0 and data and data[0] and data[0].isdigit():
+            # Every message matches, so the most recent N are the last N
+            # sequence numbers; skip a SEARCH that would list the whole mailbox
+            total = int(data[0])
+            message_ids = [b'%d' % n for n in range(max(1, total - limit + 1), total + 1)]
+        else:
+            # Search for messages
+            status, data = self.connection.search(None, search_criteria)
+            if status != 'OK':
+                raise imaplib.IMAP4.error(f"Search failed with criteria: {search_criteria}")
+            
+            message_ids = data[0].split()
+            
+            # Get most recent N messages
+            message_ids = message_ids[-limit:] if len(message_ids) > limit else message_ids
         
-        # Get most recent N messages
-        message_ids = message_ids[-limit:] if len(message_ids) > limit else message_ids
+        if not message_ids:
+            return
         
-        messages: List[Tuple[str, str]] = []
+        if header_only:
+            fetch_spec = '(BODY.PEEK[HEADER])'
+        elif body_bytes is None:
+            fetch_spec = '(BODY.PEEK[])'
+        else:
+            fetch_spec = f'(BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.{body_bytes}>)'
         
-        for msg_id in message_ids:
-            try:
-                # Fetch email
-                status, msg_data = self.connection.fetch(msg_id, '(RFC822)')
-                if status != 'OK':
+        # One round-trip per batch
+        step = batch_size or len(message_ids)
+        for start in range(0, len(message_ids), step):
+            batch = message_ids[start:start + step]
+            status, msg_data = self.connection.fetch(_optimize_sequence(batch), fetch_spec)
+            if status == 'OK':
+                raw_by_id = _parse_fetch_response(msg_data)
+            else:
+                # One bad message can fail the whole batch; retry one at a
+                # time so the rest of the batch is still delivered
+                raw_by_id = {}
+                if len(batch) > 1:
+                    for msg_id in batch:
+                        status, msg_data = self.connection.fetch(_optimize_sequence([msg_id]), fetch_spec)
+                        if status == 'OK':
+                            raw_bytes = _parse_fetch_response(msg_data).get(msg_id)
+                            if raw_bytes is not None:
+                                raw_by_id[msg_id] = raw_bytes
+            
+            for msg_id in batch:
+                raw_bytes = raw_by_id.get(msg_id)
+                if raw_bytes is None:
+                    print(f"Warning: Failed to fetch message {msg_id.decode()}")
                     continue
-                
-                raw_bytes = msg_data[0][1]
-                raw_str = raw_bytes.decode('utf-8', errors='ignore')
-                
-                messages.append((msg_id.decode(), raw_str))
-                
-            except Exception as e:
-                # Log but continue processing other messages
-                print(f"Warning: Failed to fetch message {msg_id}: {e}")
-                continue
-        
-        return messages
+                yield msg_id.decode(), raw_bytes
     
     def __enter__(self):
         """Context manager support"""
@@ -149,6 +222,221 @@ class IMAPClient:
         return False
 
 
+class IMAPConnectionPool:
+    """
+    Pool of authenticated IMAP connections to a single account.
+    
+    Opening a connection costs a TCP handshake, a TLS handshake and a
+    LOGIN. The pool keeps up to ``max_connections`` logged-in clients
+    and hands them out again, so repeated polls and multi-folder fetches
+    skip that setup. A connection idle for longer than ``keepalive``
+    seconds is checked with NOOP before reuse and replaced if the server
+    dropped it.
+    
+    Example:
+        >>> with IMAPConnectionPool('imap.gmail.com', 'user@gmail.com') as pool:
+        ...     by_folder = pool.fetch_mailboxes(['INBOX', 'Archive'], limit=20)
+        ...     with pool.acquire() as client:
+        ...         unseen = client.fetch_messages(search_criteria='UNSEEN')
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: Optional[str] = None,
+        max_connections: int = 4,
+        use_ssl: bool = True,
+        keepalive: float = 300.0,
+    ):
+        """
+        Initialize connection pool (connections are opened lazily).
+        
+        Args:
+            host: IMAP server hostname (e.g., 'imap.gmail.com')
+            username: Email address or username
+            password: Password or app-specific password (if None, will check env or prompt)
+            max_connections: Maximum simultaneous connections to the server
+            use_ssl: Whether to use SSL/TLS (recommended)
+            keepalive: Idle seconds after which a connection is NOOP-checked
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        
+        # Resolve the password once rather than prompting per connection
+        if password is None:
+            password = os.environ.get('IMAP_PASSWORD')
+            if password is None:
+                password = getpass.getpass(f"Password for {username}: ")
+        
+        self.host = host
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.max_connections = max_connections
+        self.keepalive = keepalive
+        
+        self._idle: queue.LifoQueue[Tuple[IMAPClient, float]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+    
+    @contextmanager
+    def acquire(self) -> Iterator[IMAPClient]:
+        """
+        Borrow a connected client, returning it to the pool afterwards.
+        
+        Blocks while all ``max_connections`` clients are in use. A client
+        whose connection aborts is discarded instead of being returned.
+        """
+        with self._slots:
+            client = self._checkout()
+            broken = False
+            try:
+                yield client
+            except (imaplib.IMAP4.abort, OSError):
+                broken = True
+                raise
+            finally:
+                if broken:
+                    client.disconnect()
+                else:
+                    self._idle.put((client, time.monotonic()))
+    
+    def fetch_mailboxes(
+        self,
+        mailboxes: Sequence[str],
+        limit: int = 10,
+        search_criteria: str = 'ALL',
+    ) -> Dict[str, List[Tuple[str, bytes]]]:
+        """
+        Fetch several mailboxes in parallel, one pooled connection each.
+        
+        Args:
+            mailboxes: Mailbox names (e.g. ['INBOX', 'Sent', 'Archive'])
+            limit: Maximum number of messages per mailbox
+            search_criteria: IMAP search criteria applied to every mailbox
+            
+        Returns:
+            Mapping of mailbox name to (message_id, raw_email_bytes) tuples
+        """
+        def fetch(mailbox: str) -> List[Tuple[str, bytes]]:
+            with self.acquire() as client:
+                return client.fetch_messages(mailbox, limit, search_criteria)
+        
+        if not mailboxes:
+            return {}
+        
+        workers = min(self.max_connections, len(mailboxes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(mailboxes, executor.map(fetch, mailboxes)))
+    
+    def close(self) -> None:
+        """Log out every idle connection"""
+        while True:
+            try:
+                client, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            client.disconnect()
+    
+    def _checkout(self) -> IMAPClient:
+        """Return an idle client (NOOP-checked if stale) or open a new one"""
+        while True:
+            try:
+                client, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - last_used < self.keepalive:
+                return client
+            try:
+                client.connection.noop()
+                return client
+            except (imaplib.IMAP4.error, OSError):
+                client.disconnect()
+        
+        client = IMAPClient(self.host, self.username, self.password, self.use_ssl)
+        client.connect()
+        return client
+    
+    def __enter__(self):
+        """Context manager support"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager cleanup"""
+        self.close()
+        return False
+
+
+def _optimize_sequence(message_ids: Sequence[bytes]) -> str:
+    """
+    Build a compact IMAP sequence set from message sequence numbers.
+    
+    Consecutive numbers are collapsed into ranges, so a single FETCH
+    command can request every message.
+    
+    Args:
+        message_ids: Message sequence numbers as returned by SEARCH
+        
+    Returns:
+        Sequence set string, e.g. '1,3,5:10'
+        
+    Example:
+        >>> _optimize_sequence([b'1', b'3', b'5', b'6', b'7'])
+        '1,3,5:7'
+    """
+    numbers = sorted({int(msg_id) for msg_id in message_ids})
+    ranges: List[str] = []
+    start = prev = numbers[0]
+    for number in numbers[1:]:
+        if number != prev + 1:
+            ranges.append(f"{start}:{prev}" if prev > start else str(start))
+            start = number
+        prev = number
+    ranges.append(f"{start}:{prev}" if prev > start else str(start))
+    return ",".join(ranges)
+
+
+def _parse_fetch_response(msg_data: Sequence[Any]) -> Dict[bytes, bytes]:
+    """
+    Reassemble raw messages from a multi-message FETCH response.
+    
+    imaplib returns one (prefix, literal) tuple per fetched section, e.g.
+    (b'3 (BODY[HEADER] {342}', header) followed by
+    (b' BODY[TEXT]<0> {1024}', text), with bytes lines such as b')'
+    between messages. Servers may return messages in any order. The
+    header section is placed first so header + body forms a parseable
+    message.
+    
+    Args:
+        msg_data: Data list returned by ``IMAP4.fetch``
+        
+    Returns:
+        Mapping of message sequence number to raw message bytes
+    """
+    sections_by_id: Dict[bytes, Dict[bytes, bytes]] = {}
+    sections: Dict[bytes, bytes] = {}
+    for part in msg_data:
+        if not isinstance(part, tuple):
+            continue
+        try:
+            prefix = part[0]
+            if not prefix[:1].isspace():
+                # "<seq> (" starts a new message
+                sections = sections_by_id.setdefault(prefix.split(None, 1)[0], {})
+            item = prefix.rsplit(None, 2)[-2].lstrip(b'(')
+            sections[item] = part[1]
+        except Exception as e:
+            # Log but continue processing other messages
+            print(f"Warning: Failed to parse fetched message: {e}")
+            continue
+    
+    raw_by_id: Dict[bytes, bytes] = {}
+    for seq, sections in sections_by_id.items():
+        header = sections.pop(b'BODY[HEADER]', b'')
+        raw_by_id[seq] = header + b''.join(sections.values())
+    return raw_by_id
+
+
 def fetch_imap_messages(
     host: str,
     username: str,
@@ -156,7 +444,8 @@ def fetch_imap_messages(
     mailbox: str = 'INBOX',
     limit: int = 10,
     search_criteria: str = 'ALL',
-) -> List[Tuple[str, str]]:
+    pool: Optional[IMAPConnectionPool] = None,
+) -> List[Tuple[str, bytes]]:
     """
     Convenience function to fetch messages without managing connection.
     
@@ -169,9 +458,11 @@ def fetch_imap_messages(
         mailbox: Mailbox to fetch from (default: 'INBOX')
         limit: Maximum number of messages
         search_criteria: IMAP search string
+        pool: Reuse a connection from this pool instead of opening one
+            (host, username and password are then taken from the pool)
         
     Returns:
-        List of (message_id, raw_email_string) tuples
+        List of (message_id, raw_email_bytes) tuples
         
     Example:
         >>> messages = fetch_imap_messages(
@@ -180,10 +471,55 @@ def fetch_imap_messages(
         ...     limit=5
         ... )
     """
+    if pool is not None:
+        with pool.acquire() as client:
+            return client.fetch_messages(mailbox, limit, search_criteria)
+    
     with IMAPClient(host, username, password) as client:
         return client.fetch_messages(mailbox, limit, search_criteria)
 
 
+def fetch_imap_accounts(
+    accounts: Sequence[Dict[str, Any]],
+    max_workers: int = 4,
+) -> List[List[Tuple[str, bytes]]]:
+    """
+    Fetch messages from several mailboxes or accounts concurrently.
+    
+    Each account is fetched on its own connection in a worker thread, so
+    network round-trips to different servers overlap instead of running
+    back to back. imaplib releases the GIL while waiting on the socket.
+    
+    Args:
+        accounts: One dict of ``fetch_imap_messages`` keyword arguments per
+            account (host, username, password, mailbox, limit, search_criteria).
+            Passwords should be supplied up front; prompting from worker
+            threads is not supported.
+        max_workers: Maximum number of simultaneous connections
+        
+    Returns:
+        One list of (message_id, raw_email_bytes) tuples per account,
+        in the same order as ``accounts``
+        
+    Raises:
+        imaplib.IMAP4.error: If any account fails to connect or fetch
+        
+    Example:
+        >>> inbox, archive = fetch_imap_accounts([
+        ...     {'host': 'imap.gmail.com', 'username': 'me@gmail.com', 'password': pw},
+        ...     {'host': 'imap.gmail.com', 'username': 'me@gmail.com', 'password': pw,
+        ...      'mailbox': 'Archive'},
+        ... ])
+    """
+    if not accounts:
+        return []
+    
+    workers = max(1, min(max_workers, len(accounts)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(fetch_imap_messages, **account) for account in accounts]
+        return [future.result() for future in futures]
+
+
 # Common IMAP server configurations
 IMAP_SERVERS = {
     'gmail': {
@@ -8,13 +8,36 @@ Implements PICTOGRAM-256 semantic hashing and glyph generation.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, Optional, Union
 import hashlib
+import sys
 import textwrap
+import time
 
 
-@dataclass
+# Several packets are created per email; slotted dataclasses (Python 3.10+)
+# skip the per-instance __dict__, making them smaller and faster to build.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Packet timestamps are stored as epoch nanoseconds (cheap to take per
+# packet) and only turned into datetimes when read
+_UTC_EPOCH = datetime(1970, 1, 1)
+
+# Metric bars in EmailAnalysis.pretty() are slices of these cached strings
+_BAR_WIDTH = 20
+_BAR_FULL = "█" * _BAR_WIDTH
+_BAR_EMPTY = " " * _BAR_WIDTH
+
+
+def _metric_bar(value: float) -> str:
+    """Visual metric bar, always _BAR_WIDTH cells (negative values render empty)"""
+    filled = min(max(int(value * _BAR_WIDTH), 0), _BAR_WIDTH)
+    return _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class IntentSpine:
     """
     Primary intentional vector of communication.
@@ -37,7 +60,7 @@ class IntentSpine:
         self.confidence = max(0.0, min(1.0, self.confidence))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AffectLattice:
     """
     Emotional dimensions of communication.
@@ -54,12 +77,15 @@ class AffectLattice:
     
     def __post_init__(self):
         """Clamp all values to [0, 1]"""
-        for attr in ['joy', 'sorrow', 'anger', 'fear', 'trust', 'surprise']:
-            value = getattr(self, attr)
-            setattr(self, attr, max(0.0, min(1.0, value)))
+        self.joy = max(0.0, min(1.0, self.joy))
+        self.sorrow = max(0.0, min(1.0, self.sorrow))
+        self.anger = max(0.0, min(1.0, self.anger))
+        self.fear = max(0.0, min(1.0, self.fear))
+        self.trust = max(0.0, min(1.0, self.trust))
+        self.surprise = max(0.0, min(1.0, self.surprise))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VSEPacket:
     """
     Volume-Semantic-Encoding Packet
@@ -74,7 +100,8 @@ class VSEPacket:
         semantic_motif: Cryptographic hash (SHA-256) of semantic content
         gloss: Human-readable poetic summary (legibility rule)
         confidence: Agent's confidence in this analysis
-        timestamp: When this packet was created
+        timestamp_ns: When this packet was created (UTC epoch nanoseconds;
+            see the ``timestamp`` property for a datetime)
     """
     agent_role: str
     intent_spine: IntentSpine
@@ -82,7 +109,12 @@ class VSEPacket:
     semantic_motif: bytes
     gloss: str
     confidence: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a naive UTC datetime"""
+        return _UTC_EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
 
     def to_json_dict(self) -> Dict[str, Any]:
         """Serialize packet to JSON-compatible dictionary"""
@@ -110,7 +142,7 @@ class VSEPacket:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EmailMetadata:
     """Basic email metadata extracted from headers"""
     sender: str
@@ -120,7 +152,7 @@ class EmailMetadata:
     to: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EmailAnalysis:
     """
     Final merged analysis used in CLI/JSON output.
@@ -151,16 +183,11 @@ class EmailAnalysis:
         """
         bar = "=" * 70
         
-        # Create visual metric bars
-        def metric_bar(value: float, width: int = 20) -> str:
-            filled = int(value * width)
-            return "█" * filled + " " * (width - filled)
-        
         metrics = (
-            f"   Urgency:    {metric_bar(self.urgency)} {self.urgency:0.2f}\n"
-            f"   Importance: {metric_bar(self.importance)} {self.importance:0.2f}\n"
-            f"   Warmth:     {metric_bar(self.warmth)} {self.warmth:0.2f}\n"
-            f"   Tension:    {metric_bar(self.tension)} {self.tension:0.2f}"
+            f"   Urgency:    {_metric_bar(self.urgency)} {self.urgency:0.2f}\n"
+            f"   Importance: {_metric_bar(self.importance)} {self.importance:0.2f}\n"
+            f"   Warmth:     {_metric_bar(self.warmth)} {self.warmth:0.2f}\n"
+            f"   Tension:    {_metric_bar(self.tension)} {self.tension:0.2f}"
         )
         
         output = f"""
@@ -216,7 +243,7 @@ class EmailAnalysis:
 # PICTOGRAM-256 Semantic Hashing
 # ============================================================================
 
-def semantic_hash(text: str) -> bytes:
+def semantic_hash(content: Union[str, bytes]) -> bytes:
     """
     Generate cryptographically stable semantic hash.
     
@@ -226,8 +253,13 @@ def semantic_hash(text: str) -> bytes:
     - Irreversibility (semantic privacy)
     
     This is the foundation for PICTOGRAM-256 binding.
+    
+    Args:
+        content: Text (hashed as UTF-8) or already-encoded bytes
     """
-    return hashlib.sha256(text.encode("utf-8")).digest()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).digest()
 
 
 # PICTOGRAM-256 Core Semantic Glyphs (64 primitives)
@@ -250,6 +282,9 @@ PICTOGRAM_GLYPHS = [
     "♠", "♣", "♥", "♦", "♤", "♧", "♡", "♢",
 ]
 
+# Glyph for every possible hash byte (byte value modulo the glyph count)
+_BYTE_TO_GLYPH = tuple(PICTOGRAM_GLYPHS[b % len(PICTOGRAM_GLYPHS)] for b in range(256))
+
 
 def glyph_from_hash(motif: bytes) -> str:
     """
@@ -271,29 +306,23 @@ def glyph_from_hash(motif: bytes) -> str:
     Returns:
         3-character glyph sequence (e.g., "⚡⊻≃")
     """
-    if len(motif) < 3:
-        # Fallback for short hashes
-        motif = motif + b'\x00' * (3 - len(motif))
+    if len(motif) < 17:
+        # Fallback for short hashes (bytes 0, 8 and 16 are read below)
+        motif = motif + b'\x00' * (17 - len(motif))
     
     # Extract three semantic dimensions from different hash regions
     # This provides topological separation
-    dimension_1 = motif[0] % len(PICTOGRAM_GLYPHS)
-    dimension_2 = motif[8] % len(PICTOGRAM_GLYPHS)
-    dimension_3 = motif[16] % len(PICTOGRAM_GLYPHS)
-    
-    return (
-        PICTOGRAM_GLYPHS[dimension_1] +
-        PICTOGRAM_GLYPHS[dimension_2] +
-        PICTOGRAM_GLYPHS[dimension_3]
-    )
+    return _BYTE_TO_GLYPH[motif[0]] + _BYTE_TO_GLYPH[motif[8]] + _BYTE_TO_GLYPH[motif[16]]
 
 
+@lru_cache(maxsize=4096)
 def glyph_to_color(glyph: str) -> str:
     """
     Generate stable color from glyph for visual routing.
     
     This provides consistent color mapping for the same semantic signature,
-    enabling visual pattern recognition in email interfaces.
+    enabling visual pattern recognition in email interfaces. Results are
+    memoized, since a mailbox reuses a small share of the 64³ signatures.
     """
     # Hash the glyph to get stable color
     hash_bytes = hashlib.sha256(glyph.encode('utf-8')).digest()
@@ -6,15 +6,47 @@ Handles email parsing, body extraction, and orchestrates the analysis pipeline.
 
 from __future__ import annotations
 
+import base64
+import codecs
 import email
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from email.header import decode_header
-from typing import Dict, Optional
+from email.parser import BytesParser, Parser
+from functools import lru_cache
+from html import unescape as html_unescape
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 from .model import EmailMetadata, EmailAnalysis
 from .agents import analyze_email_agents
 from .router import route_email
 
 
+# Maximum body characters passed on to the agents
+MAX_BODY_CHARS = 8000
+
+# Bytes decoded per step when only a prefix of a large body is needed
+_DECODE_CHUNK_BYTES = 16384
+
+# HTML stripping patterns: script/style elements with their content, or any tag
+_HTML_MARKUP_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>|<[^>]+>', re.DOTALL | re.IGNORECASE)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+# Terminated character references only: html.unescape alone also decodes
+# legacy names without a ';', turning '?lang=en&region=us' into '...®ion=us'
+_HTML_ENTITY_RE = re.compile(r'&(?:#\d+|#x[0-9a-f]+|[a-z]+\d*);', re.IGNORECASE)
+
+# Characters base64 decoding ignores (line breaks and other non-alphabet bytes)
+_BASE64_JUNK_RE = re.compile(rb'[^A-Za-z0-9+/=]')
+
+# Parsers are stateless between calls, so one instance of each is shared.
+# They keep the compat32 policy: header access under policy.default measured
+# several times slower, and _decode_header_value already handles RFC 2047.
+_PARSER = Parser()
+_BYTES_PARSER = BytesParser()
+
+
 def process_email(raw_email: str) -> EmailAnalysis:
     """
     Process a raw email string through the full ESPER pipeline.
@@ -37,9 +69,147 @@ def process_email(raw_email: str) -> EmailAnalysis:
         >>> analysis = process_email(raw)
         >>> print(analysis.pretty())
     """
-    # Parse email
-    msg = email.message_from_string(raw_email)
+    return _process_message(_PARSER.parsestr(raw_email))
+
+
+def process_email_bytes(raw_email: bytes) -> EmailAnalysis:
+    """
+    Process a raw email as bytes (e.g. straight from IMAP or a file).
+    
+    Parsing bytes lets each MIME part be decoded with its own declared
+    charset, instead of decoding the whole message up front.
+    
+    Args:
+        raw_email: Raw RFC822 email bytes
+        
+    Returns:
+        EmailAnalysis with complete routing decision
+    """
+    return _process_message(_BYTES_PARSER.parsebytes(raw_email))
+
+
+def process_email_file(filepath: str) -> EmailAnalysis:
+    """
+    Process an email from a file (.eml format).
+    
+    Args:
+        filepath: Path to .eml file
+        
+    Returns:
+        EmailAnalysis with complete routing decision
+        
+    Example:
+        >>> analysis = process_email_file('examples/urgent.eml')
+        >>> print(f"Route to: {analysis.routing_folder}")
+    """
+    with open(filepath, 'rb') as f:
+        raw_email = f.read()
+    return process_email_bytes(raw_email)
+
+
+def process_emails_batch(
+    raw_emails: Sequence[bytes],
+    workers: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Union[EmailAnalysis, Exception]]:
+    """
+    Process many raw emails in parallel across CPU cores.
+    
+    Parsing, HTML stripping and agent analysis are pure CPU work on each
+    message, so the batch is spread over a process pool. Small batches (or
+    workers=1) are processed in the current process.
+    
+    Args:
+        raw_emails: Raw RFC822 emails as bytes
+        workers: Number of worker processes (default: CPU count)
+        return_exceptions: Return the exception for a message that fails
+            to process instead of raising it
+        
+    Returns:
+        EmailAnalysis (or exception) per email, in input order
+        
+    Example:
+        >>> messages = client.fetch_messages(limit=500)
+        >>> analyses = process_emails_batch([raw for _, raw in messages])
+    """
+    process_one = _process_email_bytes_safe if return_exceptions else process_email_bytes
+    
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(raw_emails) <= 1:
+        return [process_one(raw) for raw in raw_emails]
+    
+    # A few chunks per worker balances load without per-message IPC overhead
+    chunksize = max(1, len(raw_emails) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(process_one, raw_emails, chunksize=chunksize))
+
+
+def process_emails_stream(
+    raw_emails: Iterable[bytes],
+    workers: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> Iterator[Union[EmailAnalysis, Exception]]:
+    """
+    Process emails from a lazy source, overlapping input with analysis.
+    
+    Unlike ``process_emails_batch`` the input need not be materialized.
+    Messages are handed to a process pool as they are drawn from
+    ``raw_emails``, so while the source blocks (e.g. an IMAP FETCH is in
+    flight) the workers analyze the messages already received. At most
+    two messages per worker are queued ahead of the consumer.
+    
+    Args:
+        raw_emails: Raw RFC822 emails as bytes, e.g. from
+            ``IMAPClient.iter_messages``
+        workers: Number of worker processes (default: CPU count)
+        return_exceptions: Yield the exception for a message that fails
+            to process instead of raising it
+        
+    Yields:
+        EmailAnalysis (or exception) per email, in input order
+        
+    Example:
+        >>> messages = client.iter_messages(limit=500)
+        >>> for analysis in process_emails_stream(raw for _, raw in messages):
+        ...     print(analysis.pretty())
+    """
+    process_one = _process_email_bytes_safe if return_exceptions else process_email_bytes
+    
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for raw in raw_emails:
+            yield process_one(raw)
+        return
+    
+    window = workers * 2
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for raw in raw_emails:
+            pending.append(executor.submit(process_one, raw))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _process_email_bytes_safe(raw_email: bytes) -> Union[EmailAnalysis, Exception]:
+    """Process one email, returning the exception instead of raising it."""
+    try:
+        return process_email_bytes(raw_email)
+    except Exception as e:
+        return e
+
+
+def _process_message(msg: email.message.Message) -> EmailAnalysis:
+    """
+    Run the analysis pipeline on a parsed email message.
     
+    Args:
+        msg: Parsed email message
+        
+    Returns:
+        EmailAnalysis with complete routing decision
+    """
     # Extract metadata
     metadata = EmailMetadata(
         sender=_decode_header_value(msg.get('From', '')),
@@ -72,31 +242,13 @@ def process_email(raw_email: str) -> EmailAnalysis:
     return analysis
 
 
-def process_email_file(filepath: str) -> EmailAnalysis:
-    """
-    Process an email from a file (.eml format).
-    
-    Args:
-        filepath: Path to .eml file
-        
-    Returns:
-        EmailAnalysis with complete routing decision
-        
-    Example:
-        >>> analysis = process_email_file('examples/urgent.eml')
-        >>> print(f"Route to: {analysis.routing_folder}")
-    """
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        raw_email = f.read()
-    return process_email(raw_email)
-
-
 def _decode_header_value(header: str) -> str:
     """
     Decode email header with proper encoding handling.
     
     Email headers can be encoded in various character sets.
-    This function handles decoding safely.
+    This function handles decoding safely. Senders and recipients repeat
+    across a mailbox, so decoded string headers are memoized.
     
     Args:
         header: Raw header string
@@ -106,7 +258,14 @@ def _decode_header_value(header: str) -> str:
     """
     if not header:
         return ""
-    
+    if isinstance(header, str):
+        return _decode_header_cached(header)
+    # Headers with raw 8-bit bytes arrive as (unhashable) Header objects
+    return _decode_header_uncached(header)
+
+
+def _decode_header_uncached(header: str) -> str:
+    """Decode a non-empty header (see _decode_header_value)."""
     try:
         decoded_parts = decode_header(header)
         result = ""
@@ -128,6 +287,9 @@ def _decode_header_value(header: str) -> str:
         return header
 
 
+_decode_header_cached = lru_cache(maxsize=4096)(_decode_header_uncached)
+
+
 def _extract_body(msg: email.message.Message) -> str:
     """
     Extract email body, handling multipart messages and different content types.
@@ -147,51 +309,48 @@ def _extract_body(msg: email.message.Message) -> str:
     body = ""
     
     if msg.is_multipart():
-        # For multipart messages, prefer text/plain over text/html
-        text_parts = []
-        html_parts = []
+        # For multipart messages, prefer text/plain over text/html.
+        # Parts are only decoded once we know they will be used, so images
+        # and other non-text parts are never base64-decoded.
+        plain_candidates = []
+        html_candidates = []
         
         for part in msg.walk():
             content_type = part.get_content_type()
-            content_disposition = str(part.get('Content-Disposition', ''))
+            if content_type != 'text/plain' and content_type != 'text/html':
+                continue
             
             # Skip attachments
-            if 'attachment' in content_disposition:
+            if 'attachment' in str(part.get('Content-Disposition', '')):
                 continue
             
-            try:
-                payload = part.get_payload(decode=True)
-                if not payload:
-                    continue
-                
-                charset = part.get_content_charset() or 'utf-8'
-                text = payload.decode(charset, errors='replace')
-                
-                if content_type == 'text/plain':
-                    text_parts.append(text)
-                elif content_type == 'text/html':
-                    html_parts.append(text)
-                    
-            except Exception:
-                continue
+            if content_type == 'text/plain':
+                plain_candidates.append(part)
+            else:
+                html_candidates.append(part)
         
-        # Prefer plain text
+        # Prefer plain text (decoded only up to the body cap)
+        text_parts = _decode_parts(plain_candidates, max_chars=MAX_BODY_CHARS)
         if text_parts:
             body = '\n\n'.join(text_parts)
-        elif html_parts:
-            # Use HTML but strip tags
-            body = _strip_html('\n\n'.join(html_parts))
+        else:
+            html_parts = _decode_parts(html_candidates)
+            if html_parts:
+                # Use HTML but strip tags
+                body = _strip_html('\n\n'.join(html_parts))
     else:
         # Single-part message
         try:
-            payload = msg.get_payload(decode=True)
+            payload = _decode_payload(msg)
             if payload:
                 charset = msg.get_content_charset() or 'utf-8'
-                body = payload.decode(charset, errors='replace')
                 
-                # Strip HTML if content type is text/html
+                # Strip HTML if content type is text/html; tags shrink the
+                # text, so HTML is decoded in full before capping
                 if msg.get_content_type() == 'text/html':
-                    body = _strip_html(body)
+                    body = _strip_html(payload.decode(charset, errors='replace'))
+                else:
+                    body = _decode_text(payload, charset, max_chars=MAX_BODY_CHARS)
         except Exception:
             # Fallback to string payload
             body = str(msg.get_payload())
@@ -199,7 +358,94 @@ def _extract_body(msg: email.message.Message) -> str:
     # Cap body length for performance (keep first 8000 chars)
     # This is sufficient for semantic analysis while preventing
     # extremely long emails from slowing processing
-    return body[:8000]
+    return body[:MAX_BODY_CHARS]
+
+
+def _decode_parts(
+    parts: List[email.message.Message],
+    max_chars: Optional[int] = None,
+) -> List[str]:
+    """
+    Decode MIME parts to text, skipping empty or undecodable parts.
+    
+    Args:
+        parts: Non-multipart message parts
+        max_chars: Stop once the parts joined by blank lines reach this
+            length (later text would be cut off anyway)
+        
+    Returns:
+        Decoded text of each usable part, in order
+    """
+    texts = []
+    total = 0
+    for part in parts:
+        try:
+            payload = _decode_payload(part)
+            if not payload:
+                continue
+            
+            charset = part.get_content_charset() or 'utf-8'
+            text = _decode_text(payload, charset, max_chars)
+        except Exception:
+            continue
+        
+        texts.append(text)
+        if max_chars is not None:
+            total += len(text) + (2 if len(texts) > 1 else 0)
+            if total >= max_chars:
+                break
+    return texts
+
+
+def _decode_payload(part: email.message.Message) -> Optional[bytes]:
+    """
+    Return a part's payload with its transfer encoding removed.
+    
+    Messages fetched with a bounded body prefix (see
+    ``IMAPClient.fetch_messages``) can end a base64 part in the middle of a
+    4-character group, which ``get_payload(decode=True)`` returns still
+    encoded. Base64 payloads are therefore cut to whole groups first.
+    """
+    if part.get('Content-Transfer-Encoding', '').strip().lower() != 'base64':
+        return part.get_payload(decode=True)
+    
+    encoded = part.get_payload()
+    if not isinstance(encoded, str):
+        return None
+    encoded_bytes = _BASE64_JUNK_RE.sub(b'', encoded.encode('ascii', errors='ignore'))
+    return base64.b64decode(encoded_bytes[:len(encoded_bytes) - len(encoded_bytes) % 4])
+
+
+def _decode_text(payload: bytes, charset: str, max_chars: Optional[int] = None) -> str:
+    """
+    Decode a payload, optionally stopping once max_chars are available.
+    
+    Decoding is incremental, so the returned text is always a prefix of
+    (or equal to) ``payload.decode(charset, errors='replace')`` and at
+    least max_chars long unless the payload runs out first.
+    
+    Raises:
+        LookupError: If the charset is unknown
+    """
+    if max_chars is None or len(payload) <= max_chars:
+        return payload.decode(charset, errors='replace')
+    
+    decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+    chunks = []
+    decoded = 0
+    try:
+        for start in range(0, len(payload), _DECODE_CHUNK_BYTES):
+            chunk = decoder.decode(payload[start:start + _DECODE_CHUNK_BYTES])
+            chunks.append(chunk)
+            decoded += len(chunk)
+            if decoded >= max_chars:
+                return ''.join(chunks)
+    except UnicodeError:
+        # Some incremental decoders are stricter than bytes.decode (e.g.
+        # UTF-16 without a BOM); fall back to decoding everything
+        return payload.decode(charset, errors='replace')
+    chunks.append(decoder.decode(b'', final=True))
+    return ''.join(chunks)
 
 
 def _strip_html(html: str) -> str:
@@ -215,24 +461,17 @@ def _strip_html(html: str) -> str:
     Returns:
         Plain text with HTML tags removed
     """
-    import re
-    
-    # Remove script and style elements
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Remove HTML tags
-    html = re.sub(r'<[^>]+>', '', html)
+    # Remove script and style elements (with their content) and all other
+    # HTML tags in a single pass
+    html = _HTML_MARKUP_RE.sub('', html)
     
-    # Decode HTML entities
-    html = html.replace('&nbsp;', ' ')
-    html = html.replace('&lt;', '<')
-    html = html.replace('&gt;', '>')
-    html = html.replace('&amp;', '&')
-    html = html.replace('&quot;', '"')
-    html = html.replace('&#39;', "'")
+    # Decode HTML entities (named and numeric); non-breaking spaces become
+    # plain spaces so keyword phrases still match
+    if '&' in html:
+        html = _HTML_ENTITY_RE.sub(lambda match: html_unescape(match.group()), html)
+    html = html.replace('\xa0', ' ')
     
     # Clean up whitespace
-    html = re.sub(r'\n\s*\n', '\n\n', html)
+    html = _BLANK_LINES_RE.sub('\n\n', html)
     
     return html.strip()
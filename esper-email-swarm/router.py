@@ -11,6 +11,7 @@ Volume 5 Invariants:
 
 from __future__ import annotations
 
+from itertools import product
 from typing import Dict, Tuple
 from .model import (
     VSEPacket,
@@ -48,11 +49,18 @@ def benevolence_clamp(packets: Dict[str, VSEPacket]) -> Tuple[float, float, floa
     
     n = float(len(packets))
     
-    # Democratic averaging across all agents
-    urgency = sum(p.intent_spine.urgency for p in packets.values()) / n
-    importance = sum(p.intent_spine.importance for p in packets.values()) / n
-    warmth = sum(p.intent_spine.warmth for p in packets.values()) / n
-    tension = sum(p.intent_spine.tension for p in packets.values()) / n
+    # Democratic averaging across all agents (one pass over the packets)
+    urgency = importance = warmth = tension = 0.0
+    for packet in packets.values():
+        spine = packet.intent_spine
+        urgency += spine.urgency
+        importance += spine.importance
+        warmth += spine.warmth
+        tension += spine.tension
+    urgency /= n
+    importance /= n
+    warmth /= n
+    tension /= n
     
     # Benevolence clamp: protect high-warmth communication
     # If warmth is very high, prevent tension from dominating
@@ -60,11 +68,12 @@ def benevolence_clamp(packets: Dict[str, VSEPacket]) -> Tuple[float, float, floa
         # Blend tension with warmth to soften harsh routing
         tension = (tension + warmth) / 2.0
     
-    # Ensure values stay in valid ranges
-    urgency = max(0.0, min(1.0, urgency))
-    importance = max(0.0, min(1.0, importance))
-    warmth = max(-1.0, min(1.0, warmth))
-    tension = max(0.0, min(1.0, tension))
+    # Ensure values stay in valid ranges (conditional expressions avoid
+    # the min()/max() call pair per value)
+    urgency = 0.0 if urgency < 0.0 else 1.0 if urgency > 1.0 else urgency
+    importance = 0.0 if importance < 0.0 else 1.0 if importance > 1.0 else importance
+    warmth = -1.0 if warmth < -1.0 else 1.0 if warmth > 1.0 else warmth
+    tension = 0.0 if tension < 0.0 else 1.0 if tension > 1.0 else tension
     
     return urgency, importance, warmth, tension
 
@@ -107,6 +116,17 @@ ROUTING_CATEGORIES = {
     },
 }
 
+# (color, priority) per folder and the routing thresholds, read once at import
+# so route_email assigns and compares plain values
+_CATEGORY_STYLE = {
+    name: (category['color'], category['priority'])
+    for name, category in ROUTING_CATEGORIES.items()
+}
+_URGENT_URGENCY = ROUTING_CATEGORIES['1-URGENT-NOW']['threshold_urgency']
+_IMPORTANT_IMPORTANCE = ROUTING_CATEGORIES['2-Important']['threshold_importance']
+_ACTION_URGENCY = ROUTING_CATEGORIES['3-Action-Required']['threshold_urgency']
+_ACTION_IMPORTANCE = ROUTING_CATEGORIES['3-Action-Required']['threshold_importance']
+
 
 def route_email(
     packets: Dict[str, VSEPacket],
@@ -133,9 +153,12 @@ def route_email(
     urgency, importance, warmth, tension = benevolence_clamp(packets)
     
     # Step 2: Generate PICTOGRAM-256 semantic fingerprint
-    # Combine all agent motifs for topologically stable glyph
-    combined_motif = b''.join(p.semantic_motif for p in packets.values())
-    icon = glyph_from_hash(combined_motif[:32])  # Use first 32 bytes (SHA-256 size)
+    # The glyph uses the first 32 bytes (SHA-256 size) of the combined agent
+    # motifs, i.e. the first packet's digest; only shorter motifs need joining
+    combined_motif = next(iter(packets.values())).semantic_motif
+    if len(combined_motif) < 32:
+        combined_motif = b''.join(p.semantic_motif for p in packets.values())
+    icon = glyph_from_hash(combined_motif[:32])
     
     # Step 3: Extract agent-specific insights
     topic_packet = packets.get('topic')
@@ -146,54 +169,25 @@ def route_email(
     
     tone_packet = packets.get('tone')
     
-    # Step 4: Newsletter/bulk mail detection
-    # Check for newsletter markers in glosses and content
-    body_text = ' '.join(p.gloss for p in packets.values()).lower()
-    subject_lower = metadata.subject.lower()
-    sender_lower = metadata.sender.lower()
-    
-    is_newsletter = any([
-        'newsletter' in body_text,
-        'unsubscribe' in body_text,
-        'digest' in subject_lower,
-        'weekly' in subject_lower and 'update' in subject_lower,
-        'newsletter@' in sender_lower,
-        'noreply@' in sender_lower,
-    ])
-    
-    # Step 5: Determine routing category
-    folder = '5-Reference'  # Default
-    color = ROUTING_CATEGORIES['5-Reference']['color']
-    priority = ROUTING_CATEGORIES['5-Reference']['priority']
-    
-    # Apply routing thresholds (in priority order)
-    if urgency > ROUTING_CATEGORIES['1-URGENT-NOW']['threshold_urgency']:
+    # Step 4-5: Determine routing category (thresholds in priority order);
+    # newsletter/bulk mail detection only runs if neither threshold fires
+    if urgency > _URGENT_URGENCY:
         folder = '1-URGENT-NOW'
-        color = ROUTING_CATEGORIES['1-URGENT-NOW']['color']
-        priority = ROUTING_CATEGORIES['1-URGENT-NOW']['priority']
-        
-    elif importance > ROUTING_CATEGORIES['2-Important']['threshold_importance']:
+    elif importance > _IMPORTANT_IMPORTANCE:
         folder = '2-Important'
-        color = ROUTING_CATEGORIES['2-Important']['color']
-        priority = ROUTING_CATEGORIES['2-Important']['priority']
-        
-    elif is_newsletter:
+    elif _is_newsletter(packets, metadata):
         folder = '4-Read-Later'
-        color = ROUTING_CATEGORIES['4-Read-Later']['color']
-        priority = ROUTING_CATEGORIES['4-Read-Later']['priority']
-        
-    elif (urgency > ROUTING_CATEGORIES['3-Action-Required']['threshold_urgency'] or
-          importance > ROUTING_CATEGORIES['3-Action-Required']['threshold_importance']):
+    elif urgency > _ACTION_URGENCY or importance > _ACTION_IMPORTANCE:
         folder = '3-Action-Required'
-        color = ROUTING_CATEGORIES['3-Action-Required']['color']
-        priority = ROUTING_CATEGORIES['3-Action-Required']['priority']
+    else:
+        folder = '5-Reference'
     
     # Step 6: Benevolence clamp for personal communications
     # High-warmth personal mail should never be auto-archived as low-priority
     if warmth > 0.6 and folder == '5-Reference':
         folder = '3-Action-Required'
-        color = ROUTING_CATEGORIES['3-Action-Required']['color']
-        priority = ROUTING_CATEGORIES['3-Action-Required']['priority']
+    
+    color, priority = _CATEGORY_STYLE[folder]
     
     # Step 7: Generate unified gloss (legibility rule)
     # Create human-readable summary of the email's meaning
@@ -224,6 +218,47 @@ def route_email(
     )
 
 
+def _is_newsletter(packets: Dict[str, VSEPacket], metadata: EmailMetadata) -> bool:
+    """
+    Detect newsletter/bulk mail from sender, subject and agent glosses.
+    
+    Checks are ordered cheapest first and stop at the first marker found.
+    Glosses are checked one at a time, which finds the same markers as
+    searching them joined (no marker contains a space).
+    """
+    subject_lower = metadata.subject.lower()
+    if 'digest' in subject_lower or ('weekly' in subject_lower and 'update' in subject_lower):
+        return True
+    
+    sender_lower = metadata.sender.lower()
+    if 'newsletter@' in sender_lower or 'noreply@' in sender_lower:
+        return True
+    
+    for packet in packets.values():
+        gloss = packet.gloss.lower()
+        if 'newsletter' in gloss or 'unsubscribe' in gloss:
+            return True
+    return False
+
+
+# Descriptor words per signal level, in gloss order: warmth, urgency,
+# importance, tension. Level 0 adds no word.
+_TONE_LEVELS = (
+    ("", "warm", "cold"),
+    ("", "urgent", "time-sensitive"),
+    ("", "significant", "important"),
+    ("", "tense"),
+)
+
+# Every combination of levels (54) mapped to its joined tone phrase
+_TONE_PHRASES: Dict[Tuple[int, ...], str] = {
+    levels: " and ".join(
+        words[level] for words, level in zip(_TONE_LEVELS, levels) if level
+    ) or "routine"
+    for levels in product(*(range(len(words)) for words in _TONE_LEVELS))
+}
+
+
 def _generate_unified_gloss(
     packets: Dict[str, VSEPacket],
     urgency: float,
@@ -249,26 +284,13 @@ def _generate_unified_gloss(
     Returns:
         Natural language summary of email meaning
     """
-    # Build tone descriptor list
-    tone_descriptors = []
-    
-    if warmth > 0.5:
-        tone_descriptors.append("warm")
-    elif warmth < -0.3:
-        tone_descriptors.append("cold")
-    
-    if urgency > 0.7:
-        tone_descriptors.append("urgent")
-    elif urgency > 0.4:
-        tone_descriptors.append("time-sensitive")
-    
-    if importance > 0.6:
-        tone_descriptors.append("significant")
-    elif importance > 0.3:
-        tone_descriptors.append("important")
-    
-    if tension > 0.5:
-        tone_descriptors.append("tense")
+    # Tone phrase for the level of each signal (0 = no descriptor)
+    tone_str = _TONE_PHRASES[
+        1 if warmth > 0.5 else 2 if warmth < -0.3 else 0,
+        1 if urgency > 0.7 else 2 if urgency > 0.4 else 0,
+        1 if importance > 0.6 else 2 if importance > 0.3 else 0,
+        1 if tension > 0.5 else 0,
+    ]
     
     # Extract topic from gloss
     if ":" in topic_gloss:
@@ -276,14 +298,6 @@ def _generate_unified_gloss(
     else:
         topic = "communication"
     
-    # Construct gloss
-    if not tone_descriptors:
-        tone_str = "routine"
-    else:
-        # Avoid repetition
-        tone_descriptors = list(dict.fromkeys(tone_descriptors))  # Remove duplicates
-        tone_str = " and ".join(tone_descriptors)
-    
     return f"A {tone_str} message about {topic}"
 
 
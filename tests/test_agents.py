@@ -10,6 +10,11 @@ from esper_email_swarm.agents import (
     analyze_topic,
     analyze_tone,
     analyze_action,
+    scan_keywords,
+    WARMTH_INDICATORS,
+    TENSION_INDICATORS,
+    FORMALITY_INDICATORS,
+    _leading_literal,
 )
 
 
@@ -106,6 +111,15 @@ class TestTopicAgent:
         assert topic == "financial"
         assert "financial" in gloss.lower()
     
+    def test_topic_domain_follows_declaration_order(self):
+        """Domain priority should not depend on where keywords appear in the text"""
+        text = "Surgery is scheduled; the invoice comes later."
+        
+        topic, _ = analyze_topic(text, {})
+        
+        # health keyword comes first in the text, but financial is declared first
+        assert topic == "financial"
+    
     def test_topic_from_subject(self):
         """Should extract topic from subject line"""
         text = "Meeting details attached."
@@ -209,6 +223,90 @@ class TestActionAgent:
         action, gloss = analyze_action(text, metadata, urgency=0.2, importance=0.2)
         
         assert "reference" in gloss.lower() or "read" in gloss.lower()
+    
+    def test_question_mark_at_end(self):
+        """A trailing question mark should still count as a reply request"""
+        text = "Are we still on?"
+        
+        action, gloss = analyze_action(text, {}, urgency=0.2, importance=0.2)
+        
+        assert gloss == "Reply within 24 hours"
+    
+    def test_overlapping_patterns_each_count(self):
+        """A phrase matched by one pattern still counts for the others"""
+        _, reply = analyze_action("please let me know", {}, urgency=0.2, importance=0.2)
+        _, schedule = analyze_action(
+            "please call me about the proposal", {}, urgency=0.2, importance=0.2
+        )
+        
+        assert reply == "Reply within 24 hours"
+        assert schedule == "Schedule a meeting or call"
+    
+    def test_no_action_phrases_falls_back(self):
+        """Without any action phrase the urgency/importance fallback applies"""
+        text = "Hello there. The weather was nice."
+        
+        _, low = analyze_action(text, {}, urgency=0.2, importance=0.2)
+        _, important = analyze_action(text, {}, urgency=0.2, importance=0.8)
+        
+        assert low == "Archive after review"
+        assert important == "Schedule response in next few days"
+    
+    def test_leading_literal_excludes_optional_chars(self):
+        """A quantified last character is not part of every match"""
+        assert _leading_literal("can you") == "can"
+        assert _leading_literal("updates?") == "update"
+        assert _leading_literal("calls*") == "call"
+        assert _leading_literal("ok{0,1}") == "o"
+        assert _leading_literal("meetings+") == "meetings"
+    
+    def test_leading_literal_rejects_top_level_alternation(self):
+        """A top-level '|' has no single leading literal"""
+        with pytest.raises(ValueError):
+            _leading_literal("fyi|heads up")
+        
+        assert _leading_literal("let me know (if|whether)") == "let"
+
+
+class TestKeywordScan:
+    """Test the fused single-pass keyword scan"""
+    
+    def test_scan_collects_all_agents(self):
+        """One scan should gather evidence for every keyword agent"""
+        text = "urgent invoice for surgery. thanks, sorry. dear sir, sincerely"
+        
+        scan = scan_keywords(text)
+        
+        assert scan.urgency_hits == 1
+        assert list(scan.domain_scores) == ['financial', 'health']
+        assert scan.dominant_domain == 'health'  # health outweighs financial
+        assert scan.warmth_count == 2   # thanks, dear
+        assert scan.tension_count == 1  # sorry
+        assert scan.formality_count == 2  # dear sir, sincerely
+    
+    def test_precomputed_scan_matches_standalone(self):
+        """Agents fed a shared scan should match standalone calls"""
+        text = "URGENT: the contract payment is due today. Thanks!"
+        metadata = {'sender': 'boss@company.com', 'subject': 'Contract'}
+        text_lower = text.lower()
+        scan = scan_keywords(text_lower)
+        
+        assert analyze_urgency(text, metadata, text_lower=text_lower, scan=scan) == \
+            analyze_urgency(text, metadata)
+        assert analyze_importance(text, metadata, scan=scan) == analyze_importance(text, metadata)
+        assert analyze_topic(text, metadata, scan=scan) == analyze_topic(text, metadata)
+        assert analyze_tone(text, metadata, scan=scan) == analyze_tone(text, metadata)
+    
+    def test_tone_counts_include_overlapping_indicators(self):
+        """Indicators nested in longer ones should each count once"""
+        text = "dear sir, hope you're well. hope all is well. frustrated, sorry sorry"
+        
+        scan = scan_keywords(text)
+        
+        assert scan.warmth_count == sum(1 for ind in WARMTH_INDICATORS if ind in text)
+        assert scan.tension_count == sum(1 for ind in TENSION_INDICATORS if ind in text)
+        assert scan.formality_count == sum(1 for ind in FORMALITY_INDICATORS if ind in text)
+        assert scan.warmth_count == 4  # dear, hope you, hope all is well, hope you're well
 
 
 class TestAgentOrchestration:
@@ -270,6 +368,45 @@ class TestAgentOrchestration:
         for role in packets1.keys():
             assert packets1[role].gloss == packets2[role].gloss
             assert packets1[role].confidence == packets2[role].confidence
+    
+    def test_repeated_email_gets_fresh_packets(self):
+        """Memoized results should still produce new, equal packets per call"""
+        text = "Please review the contract before Friday"
+        metadata = {'sender': 'legal@example.com', 'subject': 'Contract'}
+        
+        packets1 = analyze_email_agents(text, metadata)
+        packets2 = analyze_email_agents(text, dict(metadata))
+        
+        for role in packets1:
+            assert packets1[role] is not packets2[role]
+            assert packets1[role].semantic_motif == packets2[role].semantic_motif
+            assert packets1[role].intent_spine == packets2[role].intent_spine
+    
+    def test_affect_lattices_not_shared(self):
+        """Mutating one analysis' lattice should not leak into another"""
+        first = analyze_email_agents("Quarterly report attached", {})
+        first['topic'].affect_lattice.joy = 0.9
+        
+        second = analyze_email_agents("Unrelated note about lunch", {})
+        
+        for role in ('importance', 'topic', 'action'):
+            assert second[role].affect_lattice.joy == 0.0
+        assert first['importance'].affect_lattice.joy == 0.0
+    
+    def test_packets_share_timestamp(self):
+        """All packets of one email should carry the same timestamp"""
+        packets = analyze_email_agents("Lunch tomorrow?", {'sender': 'friend@example.com'})
+        
+        assert len({packet.timestamp_ns for packet in packets.values()}) == 1
+    
+    def test_metadata_changes_are_not_masked(self):
+        """Same text with a different sender or subject should be re-analyzed"""
+        text = "See you at dinner tonight, love"
+        
+        business = analyze_email_agents(text, {'sender': 'noreply@company.com'})
+        personal = analyze_email_agents(text, {'sender': 'mom@gmail.com'})
+        
+        assert personal['tone'].intent_spine.warmth != business['tone'].intent_spine.warmth
 
 
 class TestEdgeCases:
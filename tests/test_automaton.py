@@ -0,0 +1,95 @@
+"""
+Tests for the multi-pattern keyword automaton.
+"""
+
+import pytest
+from esper_email_swarm.automaton import KeywordAutomaton
+from esper_email_swarm.agents import _GLOBAL_AC, _GLOBAL_WORDS, _keyword_counts
+
+
+def build(words):
+    ac = KeywordAutomaton()
+    for i, word in enumerate(words):
+        ac.add_word(word, i)
+    ac.make_automaton()
+    return ac
+
+
+class TestKeywordAutomaton:
+    """Test single-pass keyword matching"""
+    
+    def test_reports_every_occurrence(self):
+        """Should report each occurrence with its end index"""
+        ac = build(['due', 'urgent'])
+        
+        hits = sorted(ac.iter('urgent: due today, due!'))
+        
+        assert hits == [(5, 1), (10, 0), (21, 0)]
+    
+    def test_overlapping_keywords(self):
+        """Should report keywords that share a start or overlap"""
+        ac = build(['quick', 'quickly', 'regards', 'best regards'])
+        
+        hits = sorted(payload for _, payload in ac.iter('quickly. best regards'))
+        
+        assert hits == [0, 1, 2, 3]
+    
+    def test_multiple_payloads_per_word(self):
+        """Same keyword added twice should report both payloads"""
+        ac = KeywordAutomaton()
+        ac.add_word('salary', 'financial')
+        ac.add_word('salary', 'career')
+        ac.make_automaton()
+        
+        assert sorted(p for _, p in ac.iter('salary review')) == ['career', 'financial']
+    
+    def test_special_characters(self):
+        """Keywords are literals, not regex patterns"""
+        ac = build(['dr.', 'time-sensitive', '❤'])
+        
+        assert sorted(p for _, p in ac.iter('dr. who sent ❤')) == [0, 2]
+        assert list(ac.iter('drx')) == []
+    
+    def test_no_match(self):
+        """Should yield nothing when no keyword occurs"""
+        ac = build(['invoice'])
+        
+        assert list(ac.iter('')) == []
+        assert list(ac.iter('hello world')) == []
+    
+    def test_empty_keyword_rejected(self):
+        """Should reject empty keywords"""
+        with pytest.raises(ValueError, match="empty keyword"):
+            KeywordAutomaton().add_word('', 0)
+    
+    def test_uncompiled_raises(self):
+        """Should require make_automaton before scanning"""
+        ac = KeywordAutomaton()
+        ac.add_word('urgent', 0)
+        
+        with pytest.raises(ValueError, match="not compiled"):
+            list(ac.iter('urgent'))
+
+
+class TestKeywordCounts:
+    """Agent keyword counts must match the str.count loops they replaced"""
+    
+    @pytest.mark.parametrize("text", [
+        "",
+        "urgent urgent urgent! due today, quickly please",
+        "time-sensitive and time sensitive: rush, hurry, asap",
+        "tonightonight",  # keyword overlapping itself
+        "residue and overdue are due",
+        "salary review and salary raise",  # keyword in two domains
+        "momom and dadad",
+        "dear sir, best regards and kind regards. hope you're well ❤",
+    ])
+    def test_counts_match_str_count(self, text):
+        """Should count like text.count(keyword) for every agent keyword"""
+        counts = _keyword_counts(_GLOBAL_AC, _GLOBAL_WORDS, text)
+        
+        assert counts == [text.count(kw) for kw in _GLOBAL_WORDS]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
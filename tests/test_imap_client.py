@@ -0,0 +1,241 @@
+"""
+Tests for the IMAP client (no network: the server connection is faked).
+"""
+
+from esper_email_swarm import imap_client
+from esper_email_swarm.imap_client import (
+    IMAPClient,
+    IMAPConnectionPool,
+    _optimize_sequence,
+    fetch_imap_accounts,
+)
+
+
+class FakeConnection:
+    """Minimal stand-in for imaplib.IMAP4 recording FETCH calls"""
+    
+    def __init__(self, messages):
+        self.messages = messages  # {seq_number: raw_bytes}
+        self.fetch_calls = []
+        self.search_calls = []
+        self.failing = set()  # message sets answered with NO
+    
+    def select(self, mailbox, readonly=False):
+        self.selected = mailbox
+        return 'OK', [str(len(self.messages)).encode()]
+    
+    def noop(self):
+        self.noops = getattr(self, 'noops', 0) + 1
+        return 'OK', [b'']
+    
+    def search(self, charset, criteria):
+        self.search_calls.append(criteria)
+        return 'OK', [b' '.join(str(n).encode() for n in sorted(self.messages))]
+    
+    def fetch(self, message_set, parts):
+        self.fetch_calls.append((message_set, parts))
+        if message_set in self.failing:
+            return 'NO', [b'FETCH failed']
+        data = []
+        for n in sorted(self.messages, reverse=True):  # servers may reorder
+            header, _, text = self.messages[n].partition(b'\r\n\r\n')
+            header += b'\r\n\r\n'
+            if parts == '(BODY.PEEK[])':
+                sections = [('BODY[]', header + text)]
+            elif parts == '(BODY.PEEK[HEADER])':
+                sections = [('BODY[HEADER]', header)]
+            else:
+                size = int(parts.rsplit('.', 1)[1].rstrip('>)'))
+                sections = [('BODY[HEADER]', header), ('BODY[TEXT]<0>', text[:size])]
+            for i, (item, literal) in enumerate(sections):
+                lead = f"{n} (" if i == 0 else " "
+                data.append((f"{lead}{item} {{{len(literal)}}}".encode(), literal))
+            data.append(b' FLAGS (\\Seen))')
+        return 'OK', data
+
+
+def make_client(messages):
+    client = IMAPClient('imap.example.com', 'user@example.com', password='secret')
+    client.connection = FakeConnection(messages)
+    return client
+
+
+class TestSequenceSet:
+    """Test IMAP sequence set compaction"""
+    
+    def test_collapses_runs(self):
+        """Consecutive ids should collapse into ranges"""
+        assert _optimize_sequence([b'1', b'3', b'5', b'6', b'7', b'10']) == '1,3,5:7,10'
+    
+    def test_sorts_and_dedupes(self):
+        """Unordered and repeated ids should still produce a clean set"""
+        assert _optimize_sequence([b'4', b'2', b'3', b'3']) == '2:4'
+
+
+class TestFetchMessages:
+    """Test batched message fetching"""
+    
+    def test_single_fetch_round_trip(self):
+        """All messages should be fetched with one FETCH command"""
+        client = make_client({n: f"Subject: {n}\r\n\r\nbody".encode() for n in range(1, 6)})
+        
+        messages = client.fetch_messages(limit=3)
+        
+        assert [call[0] for call in client.connection.fetch_calls] == ['3:5']
+        assert [msg_id for msg_id, _ in messages] == ['3', '4', '5']
+        assert messages[0][1] == b"Subject: 3\r\n\r\nbody"
+    
+    def test_partial_body_fetch(self):
+        """Only the headers and a bounded body prefix should be fetched"""
+        client = make_client({1: b"Subject: big\r\n\r\n" + b"x" * 100})
+        
+        messages = client.fetch_messages(body_bytes=10)
+        
+        assert client.connection.fetch_calls == [
+            ('1', '(BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.10>)')
+        ]
+        assert messages == [('1', b"Subject: big\r\n\r\n" + b"x" * 10)]
+    
+    def test_header_only_fetch(self):
+        """Header-only mode should skip the body entirely"""
+        client = make_client({1: b"Subject: hi\r\n\r\nbody"})
+        
+        messages = client.fetch_messages(header_only=True)
+        
+        assert client.connection.fetch_calls == [('1', '(BODY.PEEK[HEADER])')]
+        assert messages == [('1', b"Subject: hi\r\n\r\n")]
+    
+    def test_full_message_fetch(self):
+        """body_bytes=None should fetch the complete message"""
+        client = make_client({1: b"Subject: hi\r\n\r\n" + b"y" * 50})
+        
+        messages = client.fetch_messages(body_bytes=None)
+        
+        assert client.connection.fetch_calls == [('1', '(BODY.PEEK[])')]
+        assert messages == [('1', b"Subject: hi\r\n\r\n" + b"y" * 50)]
+    
+    def test_empty_mailbox(self):
+        """An empty search result should not issue a FETCH"""
+        client = make_client({})
+        
+        assert client.fetch_messages() == []
+        assert client.connection.fetch_calls == []
+    
+    def test_all_skips_search(self):
+        """'ALL' should take the newest ids from the SELECT count, not SEARCH"""
+        client = make_client({n: f"Subject: {n}\r\n\r\nbody".encode() for n in range(1, 6)})
+        
+        messages = client.fetch_messages(limit=2)
+        
+        assert client.connection.search_calls == []
+        assert [msg_id for msg_id, _ in messages] == ['4', '5']
+    
+    def test_other_criteria_search(self):
+        """Other criteria should still be resolved with SEARCH"""
+        client = make_client({n: f"Subject: {n}\r\n\r\nbody".encode() for n in range(1, 6)})
+        
+        messages = client.fetch_messages(limit=2, search_criteria='UNSEEN')
+        
+        assert client.connection.search_calls == ['UNSEEN']
+        assert [msg_id for msg_id, _ in messages] == ['4', '5']
+    
+    def test_iter_messages_fetches_in_batches(self):
+        """iter_messages should issue one FETCH per batch, lazily"""
+        client = make_client({n: f"Subject: {n}\r\n\r\nbody".encode() for n in range(1, 8)})
+        
+        messages = client.iter_messages(limit=5, batch_size=2)
+        first = next(messages)
+        
+        assert first[0] == '3'
+        assert [call[0] for call in client.connection.fetch_calls] == ['3:4']
+        
+        rest = list(messages)
+        
+        assert [msg_id for msg_id, _ in rest] == ['4', '5', '6', '7']
+        assert [call[0] for call in client.connection.fetch_calls] == ['3:4', '5:6', '7']
+    
+    def test_failed_batch_falls_back_to_single_fetches(self, capsys):
+        """A rejected batch should be retried per message, skipping only the bad one"""
+        client = make_client({n: f"Subject: {n}\r\n\r\nbody".encode() for n in range(1, 8)})
+        client.connection.failing = {'3:5', '4'}
+        
+        messages = list(client.iter_messages(limit=5, batch_size=3))
+        
+        assert [msg_id for msg_id, _ in messages] == ['3', '5', '6', '7']
+        assert [call[0] for call in client.connection.fetch_calls] == ['3:5', '3', '4', '5', '6:7']
+        assert "Failed to fetch message 4" in capsys.readouterr().out
+
+
+class TestFetchAccounts:
+    """Test concurrent multi-account fetching"""
+    
+    def test_results_follow_account_order(self, monkeypatch):
+        """Each account's messages should come back in input order"""
+        def fake_fetch(host, username, password=None, mailbox='INBOX', limit=10,
+                       search_criteria='ALL'):
+            return [(mailbox, f"{username}@{host}")]
+        monkeypatch.setattr(imap_client, 'fetch_imap_messages', fake_fetch)
+        
+        accounts = [
+            {'host': 'a.example.com', 'username': 'one', 'password': 'x'},
+            {'host': 'b.example.com', 'username': 'two', 'password': 'x', 'mailbox': 'Archive'},
+        ]
+        
+        results = fetch_imap_accounts(accounts)
+        
+        assert results == [
+            [('INBOX', 'one@a.example.com')],
+            [('Archive', 'two@b.example.com')],
+        ]
+    
+    def test_no_accounts(self):
+        """No accounts should mean no work"""
+        assert fetch_imap_accounts([]) == []
+
+
+class TestConnectionPool:
+    """Test pooled connection reuse"""
+    
+    def make_pool(self, monkeypatch, **kwargs):
+        opened = []
+        
+        def fake_connect(client):
+            client.connection = FakeConnection({1: b"Subject: hi\r\n\r\nbody"})
+            opened.append(client)
+        monkeypatch.setattr(IMAPClient, 'connect', fake_connect)
+        
+        pool = IMAPConnectionPool('imap.example.com', 'user@example.com', password='x', **kwargs)
+        return pool, opened
+    
+    def test_connection_reused(self, monkeypatch):
+        """Sequential acquires should share one login"""
+        pool, opened = self.make_pool(monkeypatch)
+        
+        with pool.acquire() as first:
+            first.fetch_messages()
+        with pool.acquire() as second:
+            second.fetch_messages()
+        
+        assert len(opened) == 1
+        assert first is second
+    
+    def test_stale_connection_checked(self, monkeypatch):
+        """Connections idle past the keepalive should be NOOP-checked"""
+        pool, opened = self.make_pool(monkeypatch, keepalive=0.0)
+        
+        with pool.acquire():
+            pass
+        with pool.acquire() as client:
+            assert client.connection.noops == 1
+        
+        assert len(opened) == 1
+    
+    def test_fetch_mailboxes(self, monkeypatch):
+        """Each mailbox should be fetched and keyed by name"""
+        pool, opened = self.make_pool(monkeypatch, max_connections=2)
+        
+        results = pool.fetch_mailboxes(['INBOX', 'Archive', 'Sent'])
+        
+        assert list(results) == ['INBOX', 'Archive', 'Sent']
+        assert all(messages == [('1', b"Subject: hi\r\n\r\nbody")] for messages in results.values())
+        assert len(opened) <= 2
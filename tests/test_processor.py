@@ -0,0 +1,242 @@
+"""
+Tests for email parsing and the processing pipeline.
+"""
+
+import base64
+import email
+
+from esper_email_swarm.processor import (
+    MAX_BODY_CHARS,
+    _decode_header_value,
+    _decode_text,
+    _extract_body,
+    _strip_html,
+    process_email,
+    process_email_bytes,
+    process_emails_batch,
+    process_emails_stream,
+)
+
+
+RAW_LATIN1 = (
+    b"From: Jos\xe9 <jose@example.com>\r\n"
+    b"Subject: Caf\xe9 plans\r\n"
+    b"Content-Type: text/plain; charset=iso-8859-1\r\n"
+    b"Content-Transfer-Encoding: 8bit\r\n"
+    b"\r\n"
+    b"Rendez-vous au caf\xe9 demain.\r\n"
+)
+
+RAW_MULTIPART = (
+    b"From: a@example.com\r\n"
+    b"Subject: Report\r\n"
+    b"MIME-Version: 1.0\r\n"
+    b'Content-Type: multipart/mixed; boundary="outer"\r\n'
+    b"\r\n"
+    b"--outer\r\n"
+    b'Content-Type: multipart/alternative; boundary="inner"\r\n'
+    b"\r\n"
+    b"--inner\r\n"
+    b"Content-Type: text/plain; charset=utf-8\r\n"
+    b"\r\n"
+    b"Plain version\r\n"
+    b"--inner\r\n"
+    b"Content-Type: text/html; charset=utf-8\r\n"
+    b"\r\n"
+    b"<p>HTML version</p>\r\n"
+    b"--inner--\r\n"
+    b"--outer\r\n"
+    b"Content-Type: image/png\r\n"
+    b"Content-Transfer-Encoding: base64\r\n"
+    b"\r\n"
+    b"iVBORw0KGgo=\r\n"
+    b"--outer\r\n"
+    b"Content-Type: text/plain\r\n"
+    b'Content-Disposition: attachment; filename="notes.txt"\r\n'
+    b"\r\n"
+    b"Attached notes\r\n"
+    b"--outer--\r\n"
+)
+
+
+class TestExtractBody:
+    """Test body selection in multipart messages"""
+    
+    def test_prefers_plain_text(self):
+        """text/plain should win over text/html; attachments are skipped"""
+        body = _extract_body(email.message_from_bytes(RAW_MULTIPART))
+        
+        assert body.strip() == "Plain version"
+    
+    def test_falls_back_to_html(self):
+        """Without a plain part, the HTML part should be stripped and used"""
+        raw = RAW_MULTIPART.replace(b"Plain version\r\n", b"")
+        
+        body = _extract_body(email.message_from_bytes(raw))
+        
+        assert body == "HTML version"
+    
+    def test_long_body_capped(self):
+        """Long bodies should be cut to the cap, matching a full decode"""
+        text = "Grüße aus Köln 😊 " * 2000
+        raw = (
+            b"Subject: long\r\nContent-Type: text/plain; charset=utf-8\r\n\r\n"
+            + text.encode("utf-8")
+        )
+        
+        body = _extract_body(email.message_from_bytes(raw))
+        
+        assert body == text[:MAX_BODY_CHARS]
+    
+    def test_partial_decode_is_prefix(self):
+        """Partial decoding should agree with decoding everything"""
+        payload = ("naïve café " * 5000).encode("utf-16-le")
+        
+        for charset in ("utf-16-le", "utf-16"):  # utf-16 here has no BOM
+            full = payload.decode(charset, errors="replace")
+            partial = _decode_text(payload, charset, max_chars=100)
+            assert len(partial) >= 100
+            assert full.startswith(partial)
+    
+    def test_truncated_base64_part_decoded(self):
+        """A base64 part cut at any offset (as a fetched body prefix) should still decode"""
+        html = b"<p>Weekly newsletter: project update and team news</p>" * 3
+        encoded = base64.encodebytes(html)
+        head = (
+            b"Subject: News\r\n"
+            b'Content-Type: multipart/alternative; boundary="b"\r\n'
+            b"\r\n"
+            b"--b\r\n"
+            b"Content-Type: text/html; charset=utf-8\r\n"
+            b"Content-Transfer-Encoding: base64\r\n"
+            b"\r\n"
+        )
+        
+        for cut in range(40, 44):  # every length modulo 4
+            body = _extract_body(email.message_from_bytes(head + encoded[:cut]))
+            assert body == "Weekly newsletter: project"
+
+
+class TestProcessBytes:
+    """Test processing raw email bytes"""
+    
+    def test_body_charset_honored(self):
+        """8-bit bodies should be decoded with their declared charset"""
+        body = _extract_body(email.message_from_bytes(RAW_LATIN1))
+        
+        assert body.strip() == "Rendez-vous au café demain."
+        assert process_email_bytes(RAW_LATIN1).metadata.sender.endswith("<jose@example.com>")
+    
+    def test_matches_string_input_for_ascii(self):
+        """ASCII emails should analyze the same as bytes or str"""
+        raw = "From: a@example.com\nSubject: Invoice due\n\nPlease pay the invoice by Friday.\n"
+        
+        from_str = process_email(raw)
+        from_bytes = process_email_bytes(raw.encode("ascii"))
+        
+        assert from_bytes.routing_folder == from_str.routing_folder
+        assert from_bytes.icon == from_str.icon
+        assert from_bytes.gloss == from_str.gloss
+    
+    def test_batch_matches_single(self):
+        """Parallel batch processing should match one-at-a-time results"""
+        raws = [
+            RAW_LATIN1,
+            b"From: boss@example.com\nSubject: URGENT\n\nNeed this ASAP today!!\n",
+            b"From: news@example.com\nSubject: Weekly update\n\nNewsletter: unsubscribe here\n",
+        ]
+        
+        batch = process_emails_batch(raws, workers=2)
+        
+        assert [a.routing_folder for a in batch] == \
+            [process_email_bytes(raw).routing_folder for raw in raws]
+        assert [a.icon for a in batch] == [process_email_bytes(raw).icon for raw in raws]
+    
+    def test_batch_return_exceptions(self):
+        """Failures should be returned in place when requested"""
+        results = process_emails_batch([RAW_LATIN1, None], workers=1, return_exceptions=True)
+        
+        assert results[0].metadata.subject.startswith("Caf")
+        assert isinstance(results[1], Exception)
+    
+    def test_stream_matches_batch(self):
+        """Streaming from a lazy source should match batch results, in order"""
+        raws = [
+            RAW_LATIN1,
+            b"From: boss@example.com\nSubject: URGENT\n\nNeed this ASAP today!!\n",
+            b"From: news@example.com\nSubject: Weekly update\n\nNewsletter: unsubscribe here\n",
+        ] * 3
+        
+        streamed = list(process_emails_stream((raw for raw in raws), workers=2))
+        
+        assert [a.icon for a in streamed] == [a.icon for a in process_emails_batch(raws, workers=1)]
+    
+    def test_stream_return_exceptions(self):
+        """Failures should be yielded in place when requested"""
+        results = list(process_emails_stream(iter([None, RAW_LATIN1]), workers=1, return_exceptions=True))
+        
+        assert isinstance(results[0], Exception)
+        assert results[1].metadata.subject.startswith("Caf")
+
+
+class TestDecodeHeader:
+    """Test header decoding"""
+    
+    def test_encoded_word_decoded_repeatedly(self):
+        """RFC 2047 headers should decode the same on cached repeats"""
+        raw = "=?utf-8?q?Caf=C3=A9_plans?="
+        
+        assert _decode_header_value(raw) == "Café plans"
+        assert _decode_header_value(raw) == "Café plans"
+    
+    def test_raw_8bit_header_object(self):
+        """Unhashable Header objects from 8-bit headers should still decode"""
+        msg = email.message_from_bytes(RAW_LATIN1)
+        
+        assert _decode_header_value(msg.get('From')).endswith("<jose@example.com>")
+    
+    def test_empty_header(self):
+        """Missing headers should decode to an empty string"""
+        assert _decode_header_value('') == ""
+
+
+class TestStripHtml:
+    """Test HTML to text conversion"""
+    
+    def test_removes_script_and_style_content(self):
+        """Script and style bodies should disappear along with their tags"""
+        html = (
+            "<html><head><STYLE type='text/css'>p { color: red; }</style></head>"
+            "<body><p>Hello <b>there</b></p><script>if (a < b) { go(); }</SCRIPT></body></html>"
+        )
+        
+        assert _strip_html(html) == "Hello there"
+    
+    def test_decodes_entities(self):
+        """Common HTML entities should be decoded"""
+        html = "<p>Fish &amp; chips&nbsp;&lt;today&gt; &quot;only&quot; &#39;here&#39;</p>"
+        
+        assert _strip_html(html) == "Fish & chips <today> \"only\" 'here'"
+    
+    def test_decodes_all_entities_once(self):
+        """Any named or numeric entity should decode, without double-decoding"""
+        html = "<p>Caf&eacute; &mdash; &#8364;5 &amp;lt;b&amp;gt;</p>"
+        
+        assert _strip_html(html) == "Café — €5 &lt;b&gt;"
+    
+    def test_unterminated_entities_left_alone(self):
+        """Names without a ';' (e.g. in query strings) should not be decoded"""
+        html = "<p>See example.com/?lang=en&region=us&notice=1 &copy; 2024</p>"
+        
+        assert _strip_html(html) == "See example.com/?lang=en&region=us&notice=1 © 2024"
+    
+    def test_nbsp_normalized_with_or_without_entities(self):
+        """Literal and encoded non-breaking spaces should both become spaces"""
+        assert _strip_html("<p>due\xa0today</p>") == "due today"
+        assert _strip_html("<p>due\xa0today &amp; tomorrow</p>") == "due today & tomorrow"
+    
+    def test_collapses_blank_lines(self):
+        """Runs of blank lines should collapse to a single paragraph break"""
+        html = "<p>One</p>\n\n   \n\n<p>Two</p>"
+        
+        assert _strip_html(html) == "One\n\nTwo"
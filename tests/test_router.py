@@ -5,7 +5,14 @@ Tests for routing logic and benevolent fusion.
 import pytest
 from esper_email_swarm.agents import analyze_email_agents
 from esper_email_swarm.router import route_email, benevolence_clamp
-from esper_email_swarm.model import EmailMetadata, VSEPacket, IntentSpine, AffectLattice
+from esper_email_swarm.model import (
+    EmailMetadata,
+    VSEPacket,
+    IntentSpine,
+    AffectLattice,
+    PICTOGRAM_GLYPHS,
+    glyph_from_hash,
+)
 
 
 class TestBenevolentFusion:
@@ -328,6 +335,37 @@ class TestGlyphGeneration:
         
         # Should be exactly 3 glyphs
         assert len(analysis.icon) == 3
+    
+    def test_glyph_lookup_matches_modulo(self):
+        """Each hash byte should select glyph (byte % 64)"""
+        motif = bytes(range(200, 232))
+        
+        assert glyph_from_hash(motif) == (
+            PICTOGRAM_GLYPHS[200 % 64] + PICTOGRAM_GLYPHS[208 % 64] + PICTOGRAM_GLYPHS[216 % 64]
+        )
+    
+    def test_short_motif_padded(self):
+        """Motifs shorter than 17 bytes should be zero-padded, not fail"""
+        assert glyph_from_hash(b'\x05') == PICTOGRAM_GLYPHS[5] + PICTOGRAM_GLYPHS[0] * 2
+    
+    def test_icon_from_combined_short_motifs(self):
+        """Short agent motifs should still be combined before hashing"""
+        metadata = EmailMetadata(sender="a@example.com", subject="Hi", date="")
+        packets = {
+            role: VSEPacket(
+                agent_role=role,
+                intent_spine=IntentSpine(0.0, 0.0, 0.0, 0.0, 0.9),
+                affect_lattice=AffectLattice(),
+                semantic_motif=bytes([i * 10]) * 8,
+                gloss="Test packet",
+                confidence=0.9,
+            )
+            for i, role in enumerate(['urgency', 'importance', 'topic'])
+        }
+        
+        analysis = route_email(packets, metadata)
+        
+        assert analysis.icon == PICTOGRAM_GLYPHS[0] + PICTOGRAM_GLYPHS[10] + PICTOGRAM_GLYPHS[20]
 
 
 class TestAuditability:
@@ -372,6 +410,26 @@ class TestAuditability:
             assert packet.gloss
             assert len(packet.gloss) > 0
             assert isinstance(packet.gloss, str)
+    
+    def test_pretty_metric_bars_fixed_width(self):
+        """Metric bars should be 20 cells wide, even for negative warmth"""
+        metadata = EmailMetadata(
+            sender="test@example.com",
+            subject="Test",
+            date="2024-12-03",
+        )
+        
+        packets = analyze_email_agents("Test email content", {'sender': metadata.sender})
+        analysis = route_email(packets, metadata)
+        analysis.urgency = 0.5
+        analysis.warmth = -0.4
+        
+        lines = analysis.pretty().splitlines()
+        urgency_line = next(line for line in lines if "Urgency:" in line)
+        warmth_line = next(line for line in lines if "Warmth:" in line)
+        
+        assert urgency_line == "   Urgency:    " + "█" * 10 + " " * 10 + " 0.50"
+        assert warmth_line == "   Warmth:     " + " " * 20 + " -0.40"
 
 
 if __name__ == '__main__':